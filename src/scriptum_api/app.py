@@ -11,6 +11,7 @@ from typing import Optional
 from .config import Config
 from .dependencies import create_services, ServiceContainer
 from .utils.logger import setup_logger
+from .utils.responses import OrjsonProvider
 
 logger = setup_logger(__name__)
 
@@ -38,6 +39,7 @@ def create_app(config: Optional[Config] = None, upload_folder: Optional[Path] =
 
     # Create Flask app
     app = Flask(__name__, static_folder='.', static_url_path='')
+    app.json = OrjsonProvider(app)
     app.config.from_object(config)
     app.config['MAX_CONTENT_LENGTH'] = config.MAX_VIDEO_SIZE
 
@@ -161,6 +163,7 @@ def print_banner(config: Config, services: ServiceContainer) -> None:
     print("  POST /analyze-video                - Analyze video file")
     print("  POST /recognize-movie              - Recognize movie from filename")
     print("  POST /remux-mkv-to-mp4             - Remux MKV to MP4 (instant)")
+    print("  POST /remux-cancel/<id>            - Cancel remux job")
     print("  POST /convert-to-mp4               - Convert video to MP4")
     print("  POST /extract-mkv-subtitles        - Extract MKV subtitles")
     print("  POST /detect-audio-codec           - Detect audio codec (quick)")
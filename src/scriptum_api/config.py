@@ -32,6 +32,10 @@ class Config:
 
     # Translation settings
     TRANSLATION_BATCH_SIZE = int(os.getenv('TRANSLATION_BATCH_SIZE', 25))
+    TRANSLATION_CACHE_PATH = Path(os.getenv(
+        'TRANSLATION_CACHE_PATH',
+        str(Path(os.getenv('TEMP_DIR', '/tmp')) / 'scriptum_translation_cache.sqlite3')
+    ))
     SUPPORTED_LANGUAGES = ['en', 'pt']
 
     # Temporary files
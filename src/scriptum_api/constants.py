@@ -16,6 +16,9 @@ API_TIMEOUT_LONG = 60    # For heavy operations (downloads, processing)
 BATCH_SIZE = 10  # Number of items to process in a single batch
 MAX_RETRIES = 3  # Maximum number of retry attempts for failed operations
 RETRY_DELAY_MS = 2000  # Delay between retries in milliseconds
+RETRY_BACKOFF_BASE_SEC = 0.1  # First retry waits up to this (full-jitter exponential backoff)
+RETRY_BACKOFF_CAP_SEC = 5.0  # Upper bound for a single backoff wait
+RETRY_AFTER_MAX_SEC = 30  # Longest Retry-After header honored
 
 # ============================================================================
 # Subtitle Validation
@@ -69,6 +72,12 @@ LANGUAGE_FALLBACK = {
 TRANSLATION_CHUNK_SIZE = 50  # Number of subtitle entries per translation batch
 TRANSLATION_QUALITY_CHECK = True  # Whether to validate translation output
 MIN_TRANSLATION_CONFIDENCE = 0.6  # Minimum confidence score for translations
+TRANSLATION_CONCURRENCY = 8  # Gemini batch requests in flight at once
+TRANSLATION_BATCH_MAX_TOKENS = 2000  # Estimated input tokens per Gemini batch
+TRANSLATION_CACHE_MAX_AGE_DAYS = 30  # Purge persisted line translations after this
+TRANSLATION_BATCH_API_MIN_ENTRIES = 2000  # Non-interactive jobs this large use the Gemini Batch API
+TRANSLATION_BATCH_API_POLL_SECONDS = 30  # Interval between Batch API job status checks
+TRANSLATION_BATCH_API_TIMEOUT_SECONDS = 24 * 3600  # Give up on a Batch API job after this
 
 # ============================================================================
 # Cache Settings
@@ -76,6 +85,7 @@ MIN_TRANSLATION_CONFIDENCE = 0.6  # Minimum confidence score for translations
 CACHE_DURATION_SHORT_SEC = 300   # 5 minutes - for volatile data
 CACHE_DURATION_MEDIUM_SEC = 3600  # 1 hour - for semi-stable data
 CACHE_DURATION_LONG_SEC = 86400   # 24 hours - for stable data
+SEARCH_NEGATIVE_CACHE_SEC = 30    # Failed searches - avoid hammering on 4xx
 
 # ============================================================================
 # Rate Limiting
@@ -111,10 +121,12 @@ ENV_OPENSUBTITLES_USER_AGENT = 'OPENSUBTITLES_USER_AGENT'
 # ============================================================================
 HTTP_OK = 200
 HTTP_CREATED = 201
+HTTP_NOT_MODIFIED = 304
 HTTP_BAD_REQUEST = 400
 HTTP_UNAUTHORIZED = 401
 HTTP_FORBIDDEN = 403
 HTTP_NOT_FOUND = 404
 HTTP_UNPROCESSABLE_ENTITY = 422
+HTTP_TOO_MANY_REQUESTS = 429
 HTTP_INTERNAL_ERROR = 500
 HTTP_SERVICE_UNAVAILABLE = 503
@@ -67,7 +67,11 @@ class ServiceContainer:
             subtitle_service = SubtitleService(config.OPENSUBTITLES_API_KEY)
             logger.debug("SubtitleService initialized")
 
-            translation_service = TranslationService(config.GEMINI_API_KEY)
+            translation_service = TranslationService(
+                config.GEMINI_API_KEY,
+                batch_size=config.TRANSLATION_BATCH_SIZE,
+                cache_path=config.TRANSLATION_CACHE_PATH
+            )
             logger.debug("TranslationService initialized")
 
             sync_service = SyncService()
@@ -10,11 +10,11 @@ from pathlib import Path
 import uuid
 import threading
 import subprocess
-from google.cloud import storage as gcs_storage
 
 from ..dependencies import ServiceContainer
 from ..config import Config
 from ..utils.logger import setup_logger
+from ..utils.storage import download_blob_to_file_parallel
 from ..constants import HTTP_BAD_REQUEST, HTTP_INTERNAL_ERROR
 
 GCS_BUCKET = "scriptum-uploads"
@@ -180,21 +180,17 @@ def create_audio_extraction_blueprint(services: ServiceContainer, config: Config
             # Handle GCS paths (gs://bucket/path)
             if file_path.startswith('gs://'):
                 logger.info(f"GCS path detected: {file_path} - downloading to local temp")
-                gcs_client = gcs_storage.Client()
 
                 # Parse gs://bucket/object
                 gcs_path = file_path[5:]  # strip gs://
                 bucket_name, *object_parts = gcs_path.split('/', 1)
                 object_name = object_parts[0] if object_parts else ''
 
-                bucket_ref = gcs_client.bucket(bucket_name)
-                blob = bucket_ref.blob(object_name)
-
                 # Download to temp location
                 local_filename = object_name.split('/')[-1]
                 video_path = Path(config.TEMP_DIR) / local_filename
                 logger.info(f"Downloading {file_path} to {video_path} ...")
-                blob.download_to_filename(str(video_path))
+                download_blob_to_file_parallel(object_name, str(video_path), bucket_name=bucket_name)
                 logger.info(f"GCS download complete: {video_path} ({video_path.stat().st_size:,} bytes)")
             else:
                 video_path = Path(file_path)
@@ -10,6 +10,7 @@ import hashlib
 import time
 from google.cloud import firestore, storage
 from ..utils.logger import setup_logger
+from ..utils.storage import delete_blobs
 
 logger = setup_logger(__name__)
 
@@ -286,7 +287,7 @@ def create_chunked_upload_blueprint():
             try:
                 blobs_to_delete = list(bucket.list_blobs(prefix=f"{GCS_CHUNKS_PREFIX}/{upload_id}/"))
                 if blobs_to_delete:
-                    bucket.delete_blobs(blobs_to_delete)
+                    delete_blobs(blobs_to_delete, bucket=bucket)
                     logger.info(f"Deleted {len(blobs_to_delete)} chunk/intermediate blobs from GCS")
             except Exception as e:
                 logger.warning(f"Failed to cleanup GCS chunks: {e}")
@@ -13,6 +13,8 @@ from ..dependencies import ServiceContainer
 from ..config import Config
 from ..utils.logger import setup_logger
 from ..constants import HTTP_BAD_REQUEST, HTTP_INTERNAL_ERROR
+from ..utils.sync_utils import language_from_filename, normalize_language
+from ..utils.storage import download_blob_to_file_parallel
 
 logger = setup_logger(__name__)
 
@@ -47,6 +49,11 @@ def create_sync_blueprint(services: ServiceContainer, config: Config) -> Bluepri
             Option 2 (after parallel upload):
                 - video_path: GCS path (string)
                 - subtitle: SRT file
+            Optional:
+                - audio_language: spoken language of the video; skips
+                  audio language detection. Without it the language is
+                  detected from the audio, falling back to the subtitle
+                  filename tag (movie.en.srt) or English if detection fails
 
         Response: JSON with result
         """
@@ -69,6 +76,12 @@ def create_sync_blueprint(services: ServiceContainer, config: Config) -> Bluepri
             logger.warning("sync: Missing video file or video_path in request")
             return jsonify({'error': 'Missing video file or video_path'}), HTTP_BAD_REQUEST
 
+        # Only an explicit audio language skips the Whisper language-detection
+        # pass; the subtitle's own language (often a translation) is just the
+        # fallback if detection fails
+        audio_language = normalize_language(request.form.get('audio_language'))
+        fallback_language = language_from_filename(subtitle_file.filename)
+
         timestamp = int(time.time())
 
         # Handle video source
@@ -121,7 +134,7 @@ def create_sync_blueprint(services: ServiceContainer, config: Config) -> Bluepri
 
                 video_path = UPLOAD_FOLDER / f"sync_video_{timestamp}_{video_filename}"
                 logger.info(f"Downloading video from GCS ({video_size_gb:.2f}GB)...")
-                blob.download_to_filename(str(video_path))
+                download_blob_to_file_parallel(object_name, str(video_path), bucket_name=bucket_name)
                 logger.info(f"Video downloaded ({video_path.stat().st_size:,} bytes)")
         else:
             # Traditional file upload
@@ -165,7 +178,9 @@ def create_sync_blueprint(services: ServiceContainer, config: Config) -> Bluepri
                     output_path,
                     tmpdir_path,
                     log_path,
-                    gcs_video_path=video_gcs_path
+                    gcs_video_path=video_gcs_path,
+                    audio_language=audio_language,
+                    fallback_language=fallback_language
                 )
 
             # Clean up temp files
@@ -10,12 +10,12 @@ import tempfile
 import base64
 import uuid
 import threading
-import subprocess
 from google.cloud import storage as gcs_storage
 
 from ..dependencies import ServiceContainer
 from ..config import Config
 from ..utils.logger import setup_logger
+from ..utils.storage import download_blob_to_file_parallel
 from ..constants import HTTP_BAD_REQUEST, HTTP_INTERNAL_ERROR
 
 GCS_BUCKET = "scriptum-uploads"
@@ -93,10 +93,26 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
                 logger.error(f"Video analysis failed: {e}", exc_info=True)
                 return jsonify({'error': f'Analysis failed: {str(e)}'}), HTTP_INTERNAL_ERROR
 
+    # Cancel events of remux jobs running in this process, by job id
+    remux_cancel_events = {}
+
     def _remux_background(job_id: str, gcs_input_path: str, filename: str):
         """Background remux: download from GCS → ffmpeg stream copy → upload output to GCS"""
         output_path = None
         input_path = None
+        cancel_event = remux_cancel_events[job_id]
+
+        def progress_update(progress_data):
+            """Map ffmpeg progress onto the 40-80% remuxing stage"""
+            percentage = 40 + progress_data['percentage'] * 40 // 100
+            services.job_storage_service.update_job(job_id, {
+                'progress': {
+                    'percentage': percentage,
+                    'message': f"A remuxar para MP4... {progress_data['percentage']}%",
+                    'stage': 'remuxing'
+                }
+            })
+
         try:
             services.job_storage_service.update_job(job_id, {
                 'status': 'processing',
@@ -112,9 +128,13 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
             # Download input to temp
             input_path = Path(config.TEMP_DIR) / f"remux_in_{job_id}_{filename}"
             logger.info(f"Job {job_id}: Downloading {gcs_input_path} to {input_path}")
-            input_blob.download_to_filename(str(input_path))
+            download_blob_to_file_parallel(object_name, str(input_path), bucket_name=bucket_name)
             logger.info(f"Job {job_id}: Download complete ({input_path.stat().st_size / (1024**3):.2f} GB)")
 
+            if cancel_event.is_set():
+                logger.info(f"Job {job_id}: Cancelled before remux")
+                return
+
             services.job_storage_service.update_job(job_id, {
                 'progress': {'percentage': 40, 'message': 'A remuxar para MP4...', 'stage': 'remuxing'}
             })
@@ -123,21 +143,24 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
             output_path = Path(config.TEMP_DIR) / f"remux_out_{job_id}_{output_filename}"
 
             # Remux: stream copy MKV → MP4 (no re-encoding)
-            result = subprocess.run([
-                'ffmpeg', '-y',
-                '-i', str(input_path),
-                '-c', 'copy',
-                '-movflags', 'faststart',
-                str(output_path)
-            ], capture_output=True, text=True, timeout=3600)
+            success = services.video_service.remux_to_mp4(
+                input_path,
+                output_path,
+                progress_callback=progress_update,
+                cancel_event=cancel_event
+            )
 
             # Clean up input immediately after remux
             if input_path.exists():
                 input_path.unlink()
                 input_path = None
 
-            if result.returncode != 0 or not output_path.exists() or output_path.stat().st_size == 0:
-                raise Exception(f"ffmpeg failed: {result.stderr[-500:]}")
+            if cancel_event.is_set():
+                logger.info(f"Job {job_id}: Remux cancelled")
+                return
+
+            if not success or not output_path.exists() or output_path.stat().st_size == 0:
+                raise Exception("ffmpeg remux failed")
 
             output_size_mb = output_path.stat().st_size / (1024 * 1024)
             logger.info(f"Job {job_id}: Remux complete ({output_size_mb:.1f} MB)")
@@ -179,6 +202,9 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
                 'error': str(e),
                 'progress': {'percentage': 0, 'message': f'Erro: {str(e)}', 'stage': 'error'}
             })
+
+        finally:
+            remux_cancel_events.pop(job_id, None)
             if input_path and input_path.exists():
                 input_path.unlink()
             if output_path and output_path.exists():
@@ -209,6 +235,7 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
             'progress': {'percentage': 0, 'message': 'A aguardar...', 'stage': 'pending'}
         }
         services.job_storage_service.create_job(job_id, job_data)
+        remux_cancel_events[job_id] = threading.Event()
 
         thread = threading.Thread(target=_remux_background, args=(job_id, gcs_path, filename))
         thread.daemon = True
@@ -236,6 +263,36 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
             response['error'] = job.get('error', 'Unknown error')
         return jsonify(response)
 
+    @bp.route('/remux-cancel/<job_id>', methods=['POST'])
+    def remux_cancel(job_id: str):
+        """
+        Cancel a remux job.
+
+        Stops the ffmpeg process if the job is running on this instance; the
+        job is marked as cancelled either way.
+        """
+        job = services.job_storage_service.get_job(job_id)
+        if not job:
+            return jsonify({'success': False, 'error': 'Job not found'}), 404
+
+        if job['status'] in ['completed', 'error', 'cancelled']:
+            return jsonify({
+                'success': False,
+                'error': f'Cannot cancel job in {job["status"]} state'
+            }), HTTP_BAD_REQUEST
+
+        cancel_event = remux_cancel_events.get(job_id)
+        if cancel_event is not None:
+            cancel_event.set()
+
+        services.job_storage_service.update_job(job_id, {
+            'status': 'cancelled',
+            'progress': {'percentage': 0, 'message': 'Remux cancelado', 'stage': 'cancelled'}
+        })
+
+        logger.info(f"Job {job_id}: Remux cancelled by user")
+        return jsonify({'success': True, 'message': 'Remux job cancelled'})
+
     @bp.route('/remux-download/<job_id>', methods=['GET'])
     def remux_download(job_id: str):
         """Stream remuxed MP4 from GCS to client."""
@@ -293,6 +350,18 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
 
         logger.info(f"Converting to MP4: {video_file.filename} (quality: {quality})")
 
+        logged_steps = set()
+
+        def log_progress(progress_data):
+            """Log conversion progress every 10%"""
+            step = progress_data['percentage'] // 10
+            if step not in logged_steps:
+                logged_steps.add(step)
+                logger.info(
+                    f"Converting {video_file.filename}: {progress_data['percentage']}% "
+                    f"(fps: {progress_data['fps']}, speed: {progress_data['speed']})"
+                )
+
         with tempfile.TemporaryDirectory() as tmpdir:
             tmp = Path(tmpdir)
             input_path = tmp / video_file.filename
@@ -303,7 +372,9 @@ def create_video_blueprint(services: ServiceContainer, config: Config) -> Bluepr
 
             try:
                 # Convert using service
-                success = services.video_service.convert_to_mp4(input_path, output_path, quality)
+                success = services.video_service.convert_to_mp4(
+                    input_path, output_path, quality, progress_callback=log_progress
+                )
 
                 if not success:
                     logger.error(f"Conversion failed: {video_file.filename}")
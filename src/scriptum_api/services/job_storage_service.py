@@ -10,6 +10,9 @@ from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Single sentinel reference reused for every timestamped write
+_TS = firestore.SERVER_TIMESTAMP
+
 
 class JobStorageService:
     """
@@ -41,11 +44,11 @@ class JobStorageService:
             True if successful
         """
         try:
-            # Add metadata
-            job_data['created_at'] = firestore.SERVER_TIMESTAMP
-            job_data['updated_at'] = firestore.SERVER_TIMESTAMP
+            # Build write payload without mutating the caller's dict
+            payload = {**job_data, 'created_at': _TS, 'updated_at': _TS}
 
-            self.collection.document(job_id).set(job_data)
+            # create() fails if the document already exists
+            self.collection.document(job_id).create(payload)
             logger.info(f"Created job {job_id}")
             return True
 
@@ -91,7 +94,7 @@ class JobStorageService:
         """
         try:
             # Add update timestamp
-            updates['updated_at'] = firestore.SERVER_TIMESTAMP
+            updates['updated_at'] = _TS
 
             self.collection.document(job_id).update(updates)
             logger.debug(f"Updated job {job_id}")
@@ -4,11 +4,66 @@ Handles OpenSubtitles API integration for subtitle search and download
 """
 import requests
 import gzip
+import io
+import logging
+import os
+import struct
 import base64
 import re
-from typing import List, Dict, Any, Optional
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from pathlib import Path
-from difflib import SequenceMatcher
+
+from cachetools import TTLCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON parser
+    orjson = None
+
+from ..constants import CACHE_DURATION_SHORT_SEC, CACHE_DURATION_LONG_SEC, SEARCH_NEGATIVE_CACHE_SEC
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Common words to ignore when comparing titles
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'of', 'to', 'in', 'for', 'on', 'with'})
+
+# Precompiled patterns for relevance scoring and filename parsing
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_WORD_RE = re.compile(r'\w+')
+# Separators become spaces and release tags are dropped in a single scan.
+# Tag boundaries treat '_' as a separator, matching the old two-pass result.
+_QUICK_RE = re.compile(
+    r'(?P<sep>[.\-_])'
+    r'|(?<![^\W_])(?i:1080p|720p|480p|2160p|4K|BluRay|WEB-DL|WEBRip|HDTV|DVDRip|BRRip|x264|x265|HEVC|AAC|AC3|DTS|YIFY|RARBG|AMZN)(?![^\W_])'
+)
+
+# log10(downloads + 1) / 5.0 maps 100k downloads to 1.0
+_DOWNLOAD_LOG_SCALE = 1 / 5.0
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+# OpenSubtitles hash: file size plus the first and last 64kb as uint64 words
+_HASH_CHUNK_SIZE = 65536
+_HASH_STRUCT = struct.Struct('<%dQ' % (_HASH_CHUNK_SIZE // 8))
+
+
+@lru_cache(maxsize=1024)
+def _download_score(downloads: int) -> float:
+    """Normalize a download count to 0-1 (log scale); counts recur heavily"""
+    return min(1.0, math.log10(downloads + 1) * _DOWNLOAD_LOG_SCALE) if downloads > 0 else 0
+
+
+def _load_json(response: requests.Response) -> Any:
+    """Parse a JSON response body, with orjson straight from bytes when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 class SubtitleService:
@@ -24,57 +79,166 @@ class SubtitleService:
         self.api_key = api_key
         self.base_url = "https://api.opensubtitles.com/api/v1"
         self.user_agent = "Scriptum v2.1"
-
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests"""
-        return {
+        # Shared session so TCP/TLS connections are reused across calls
+        self._session = requests.Session()
+        # Search results cached per request signature; failures cached briefly
+        self._search_cache = TTLCache(maxsize=512, ttl=CACHE_DURATION_SHORT_SEC)
+        self._negative_cache = TTLCache(maxsize=256, ttl=SEARCH_NEGATIVE_CACHE_SEC)
+        # ETag validators outlive the TTL cache so stale entries can be revalidated
+        self._etag_cache = TTLCache(maxsize=512, ttl=CACHE_DURATION_LONG_SEC)
+        self._cache_lock = threading.Lock()
+
+    def _get_headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Get headers for API requests, merged with optional extra headers"""
+        headers = {
             'Api-Key': self.api_key,
             'User-Agent': self.user_agent,
             'Content-Type': 'application/json'
         }
+        if extra:
+            headers.update(extra)
+        return headers
 
-    def _calculate_relevance(self, query: str, movie_name: str) -> float:
+    def _get_cached(self, key: tuple) -> Optional[List[Dict[str, Any]]]:
         """
-        Calculate relevance score between query and movie name
+        Look up a cached search result
 
         Args:
-            query: Search query
-            movie_name: Movie name from result
+            key: Request signature
 
         Returns:
-            Relevance score (0.0 - 1.0)
+            Copy of the cached results, or None on a miss
         """
-        # Common words to ignore
-        STOP_WORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'of', 'to', 'in', 'for', 'on', 'with'}
+        with self._cache_lock:
+            if key in self._negative_cache:
+                return []
+            cached = self._search_cache.get(key)
+        if cached is None:
+            return None
+        # Callers annotate results in place (e.g. 'source'), so hand out copies
+        return [dict(item) for item in cached]
 
-        # Normalize strings
-        query_norm = query.lower().strip()
-        movie_norm = movie_name.lower().strip()
+    def _store_cached(self, key: tuple, results: Optional[List[Dict[str, Any]]]) -> None:
+        """
+        Store a search result, or a short-lived negative entry when None
 
-        # Remove year from both for comparison
-        query_clean = re.sub(r'\b(19|20)\d{2}\b', '', query_norm).strip()
-        movie_clean = re.sub(r'\b(19|20)\d{2}\b', '', movie_norm).strip()
+        Args:
+            key: Request signature
+            results: Results to cache, None for a failed request
+        """
+        with self._cache_lock:
+            if results is None:
+                self._negative_cache[key] = True
+            else:
+                self._search_cache[key] = [dict(item) for item in results]
+
+    def _search_request(
+        self, cache_key: tuple, params: Dict[str, Any]
+    ) -> Tuple[requests.Response, Optional[List[Dict[str, Any]]]]:
+        """
+        GET the subtitles endpoint, revalidating a previous response by ETag
 
-        # Extract main keywords (words longer than 2 chars, excluding stop words)
-        query_words = set([w for w in re.findall(r'\w+', query_clean) if len(w) > 2 and w not in STOP_WORDS])
-        movie_words = set([w for w in re.findall(r'\w+', movie_clean) if len(w) > 2 and w not in STOP_WORDS])
+        Args:
+            cache_key: Request signature
+            params: Query parameters
 
+        Returns:
+            Tuple of (response, cached results if the server answered 304)
+        """
+        with self._cache_lock:
+            validator = self._etag_cache.get(cache_key)
+
+        extra = {'If-None-Match': validator[0]} if validator else None
+        response = self._session.get(
+            f"{self.base_url}/subtitles",
+            headers=self._get_headers(extra),
+            params=params,
+            timeout=10
+        )
+
+        if response.status_code == 304 and validator:
+            logger.debug("Search not modified, reusing cached results: %s", params)
+            self._store_cached(cache_key, validator[1])
+            return response, [dict(item) for item in validator[1]]
+
+        return response, None
+
+    def _remember_etag(self, cache_key: tuple, response: requests.Response, results: List[Dict[str, Any]]) -> None:
+        """
+        Keep the response ETag alongside its parsed results for revalidation
+
+        Args:
+            cache_key: Request signature
+            response: Successful API response
+            results: Results parsed from the response
+        """
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._cache_lock:
+                self._etag_cache[cache_key] = (etag, [dict(item) for item in results])
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _extract_words(text: str) -> FrozenSet[str]:
+        """
+        Extract meaningful keywords from a title
+
+        Cached because movie names recur across searches and languages; the
+        frozenset result can be shared between callers safely.
+
+        Args:
+            text: Query or movie name
+
+        Returns:
+            Case-folded words longer than 2 chars, without years or stop words
+        """
+        clean = _YEAR_RE.sub('', text.casefold())
+        return frozenset(w for w in _WORD_RE.findall(clean) if len(w) > 2 and w not in STOP_WORDS)
+
+    @staticmethod
+    def _prepare_query(query: str) -> FrozenSet[str]:
+        """
+        Tokenize a search query once so it can be scored against many results
+
+        Args:
+            query: Search query
+
+        Returns:
+            Query keywords
+        """
+        return SubtitleService._extract_words(query)
+
+    @staticmethod
+    def _score_movie(query_words: FrozenSet[str], movie_name: str) -> float:
+        """
+        Score a movie name against a prepared query
+
+        Args:
+            query_words: Result of _prepare_query
+            movie_name: Movie name from result
+
+        Returns:
+            Relevance score (0.0 - 1.0)
+        """
         if not query_words:
             return 0.5
 
+        movie_words = SubtitleService._extract_words(movie_name)
+
         # Calculate word overlap
         common_words = query_words & movie_words
-        word_overlap = len(common_words) / len(query_words) if query_words else 0
+        word_overlap = len(common_words) / len(query_words)
 
-        # Calculate sequence similarity (only on meaningful words)
-        query_meaningful = ' '.join(sorted(query_words))
-        movie_meaningful = ' '.join(sorted(movie_words))
-        sequence_sim = SequenceMatcher(None, query_meaningful, movie_meaningful).ratio()
+        # Below 50% overlap the score cannot reach the 0.6 cut-off, even with
+        # perfect similarity, so skip the similarity term
+        if word_overlap < 0.5:
+            return word_overlap * 0.8
 
-        # Combined score (heavily favor word overlap for exact matches)
-        score = (word_overlap * 0.8) + (sequence_sim * 0.2)
+        # Token-set similarity (Dice coefficient on the keyword sets)
+        sequence_sim = 2 * len(common_words) / (len(query_words) + len(movie_words))
 
-        return score
+        # Combined score (heavily favor word overlap for exact matches)
+        return (word_overlap * 0.8) + (sequence_sim * 0.2)
 
     def _filter_and_sort_results(self, results: List[Dict[str, Any]], query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -88,41 +252,37 @@ class SubtitleService:
         Returns:
             Filtered and sorted results
         """
-        # Calculate relevance for each result
-        scored_results = []
-        for result in results:
-            movie_name = result.get('name', '')
-            relevance = self._calculate_relevance(query, movie_name)
-
-            # Only keep results with decent relevance (>60%)
-            if relevance >= 0.6:
-                # Calculate combined score (relevance + popularity)
-                downloads = result.get('downloads', 0)
-                rating = result.get('rating', 0)
-
-                # Normalize downloads to 0-1 scale (log scale for better distribution)
-                import math
-                download_score = min(1.0, math.log10(downloads + 1) / 5.0) if downloads > 0 else 0
-
-                # Normalize rating to 0-1 scale
-                rating_score = rating / 10.0 if rating > 0 else 0
-
-                # Combined score: 60% relevance, 25% downloads, 15% rating
-                combined_score = (relevance * 0.6) + (download_score * 0.25) + (rating_score * 0.15)
-
-                scored_results.append({
-                    **result,
-                    '_relevance': relevance,
-                    '_score': combined_score
-                })
+        # Tokenize the query once for all results
+        query_words = self._prepare_query(query)
+
+        # Struct-of-arrays view of the fields used for scoring
+        names = [result.get('name', '') for result in results]
+        downloads = [result.get('downloads', 0) for result in results]
+        ratings = [result.get('rating', 0) for result in results]
+
+        relevances = [self._score_movie(query_words, name) for name in names]
+
+        # Score only results with decent relevance (>60%) as (score, index) pairs
+        scored = []
+        for i, relevance in enumerate(relevances):
+            if relevance < 0.6:
+                continue
+
+            # Normalize downloads to 0-1 scale (log scale for better distribution)
+            download_score = _download_score(downloads[i])
 
-        # Sort by combined score (descending)
-        scored_results.sort(key=lambda x: x['_score'], reverse=True)
+            # Normalize rating to 0-1 scale
+            rating = ratings[i]
+            rating_score = rating / 10.0 if rating > 0 else 0
 
-        # Remove scoring metadata and return top results
-        filtered = [{k: v for k, v in r.items() if not k.startswith('_')} for r in scored_results[:limit]]
+            # Combined score: 60% relevance, 25% downloads, 15% rating
+            scored.append(((relevance * 0.6) + (download_score * 0.25) + (rating_score * 0.15), i))
 
-        print(f"🎯 Filtradas {len(filtered)} de {len(results)} legendas (relevância mínima: 60%)")
+        # Sort by combined score (descending, stable on ties) and slice the originals
+        scored.sort(key=itemgetter(0), reverse=True)
+        filtered = [results[i] for _, i in scored[:limit]]
+
+        logger.debug("Filtered %d of %d subtitles (minimum relevance: 60%%)", len(filtered), len(results))
 
         return filtered
 
@@ -139,30 +299,34 @@ class SubtitleService:
             List of subtitle results
         """
         if not self.api_key:
-            print("⚠️  OpenSubtitles API key not configured")
+            logger.warning("OpenSubtitles API key not configured")
             return []
 
+        cache_key = ('query', query, language, limit)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.debug("Cache hit for query: %s (%s)", query, language)
+            return cached
+
         try:
             params = {
                 'query': query,
                 'languages': language,
             }
 
-            response = requests.get(
-                f"{self.base_url}/subtitles",
-                headers=self._get_headers(),
-                params=params,
-                timeout=10
-            )
+            response, revalidated = self._search_request(cache_key, params)
+            if revalidated is not None:
+                return revalidated
 
             if response.status_code != 200:
-                print(f"⚠️  OpenSubtitles search failed: {response.status_code}")
+                logger.warning("OpenSubtitles search failed: %s", response.status_code)
+                self._store_cached(cache_key, None)
                 return []
 
-            data = response.json()
+            data = _load_json(response)
             results = data.get('data', [])
 
-            print(f"📦 API retornou {len(results)} resultados brutos")
+            logger.debug("API returned %d raw results", len(results))
 
             subtitles = []
             for item in results:
@@ -192,19 +356,48 @@ class SubtitleService:
             # Filter and sort by relevance
             filtered_subtitles = self._filter_and_sort_results(subtitles, query, limit)
 
-            print(f"✅ Retornadas {len(filtered_subtitles)} legendas relevantes")
+            logger.info("Returning %d relevant subtitles", len(filtered_subtitles))
+            self._store_cached(cache_key, filtered_subtitles)
+            self._remember_etag(cache_key, response, filtered_subtitles)
             return filtered_subtitles
 
         except Exception as e:
-            print(f"❌ Error searching subtitles: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Error searching subtitles: %s", e, exc_info=True)
             return []
 
+    def search_by_query_multi(self, query: str, languages: List[str], limit: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search subtitles by query string in several languages concurrently
+
+        Args:
+            query: Search query (movie name)
+            languages: Language codes to search
+            limit: Maximum results per language
+
+        Returns:
+            Dict mapping language code to its subtitle results
+        """
+        if not languages:
+            return {}
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            futures = {
+                executor.submit(self.search_by_query, query, lang, limit): lang
+                for lang in languages
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
     def search_by_hash(self, file_hash: str, file_size: int, language: str = 'pt') -> List[Dict[str, Any]]:
         """
         Search subtitles by video file hash (most accurate)
 
+        Every hit matches the exact file, so results skip the query-based
+        relevance filter and are ranked by popularity only.
+
         Args:
             file_hash: OpenSubtitles hash of video file
             file_size: Video file size in bytes
@@ -214,27 +407,30 @@ class SubtitleService:
             List of subtitle results
         """
         if not self.api_key:
-            print("⚠️  OpenSubtitles API key not configured")
+            logger.warning("OpenSubtitles API key not configured")
             return []
 
+        cache_key = ('hash', file_hash, file_size, language)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             params = {
                 'moviehash': file_hash,
                 'languages': language,
             }
 
-            response = requests.get(
-                f"{self.base_url}/subtitles",
-                headers=self._get_headers(),
-                params=params,
-                timeout=10
-            )
+            response, revalidated = self._search_request(cache_key, params)
+            if revalidated is not None:
+                return revalidated
 
             if response.status_code != 200:
-                print(f"⚠️  OpenSubtitles hash search failed: {response.status_code}")
+                logger.warning("OpenSubtitles hash search failed: %s", response.status_code)
+                self._store_cached(cache_key, None)
                 return []
 
-            data = response.json()
+            data = _load_json(response)
             results = data.get('data', [])
 
             subtitles = []
@@ -257,10 +453,15 @@ class SubtitleService:
                     'feature_details': attributes.get('feature_details', {}),
                 })
 
+            # Hash matches are relevant by construction: rank by popularity
+            subtitles.sort(key=itemgetter('downloads', 'rating'), reverse=True)
+
+            self._store_cached(cache_key, subtitles)
+            self._remember_etag(cache_key, response, subtitles)
             return subtitles
 
         except Exception as e:
-            print(f"❌ Error searching by hash: {e}")
+            logger.error("Error searching by hash: %s", e)
             return []
 
     def download_subtitle(self, file_id: int) -> Optional[bytes]:
@@ -274,7 +475,7 @@ class SubtitleService:
             Subtitle file content as bytes or None
         """
         if not self.api_key:
-            print("⚠️  OpenSubtitles API key not configured")
+            logger.warning("OpenSubtitles API key not configured")
             return None
 
         try:
@@ -283,57 +484,63 @@ class SubtitleService:
                 'file_id': file_id
             }
 
-            print(f"DEBUG: Sending request to {self.base_url}/download")
-            print(f"DEBUG: Payload: {payload}")
-            print(f"DEBUG: Headers: {self._get_headers()}")
+            logger.debug("Sending request to %s/download with payload %s", self.base_url, payload)
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/download",
                 headers=self._get_headers(),
                 json=payload,
                 timeout=10
             )
 
-            print(f"DEBUG: Response status: {response.status_code}")
-            print(f"DEBUG: Response body: {response.text[:200]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response status: %s, body: %s", response.status_code, response.text[:200])
 
             if response.status_code != 200:
-                print(f"⚠️  Download request failed: {response.status_code}")
-                print(f"⚠️  Response: {response.text}")
+                logger.warning("Download request failed: %s - %s", response.status_code, response.text)
                 return None
 
             data = response.json()
             download_link = data.get('link')
 
             if not download_link:
-                print("❌ No download link provided")
+                logger.error("No download link provided")
                 return None
 
             # Step 2: Download the file
-            print(f"DEBUG: Downloading from link: {download_link[:100]}...")
-            download_response = requests.get(
+            logger.debug("Downloading from link: %.100s...", download_link)
+            download_response = self._session.get(
                 download_link,
                 headers={'User-Agent': self.user_agent},
-                timeout=30
+                timeout=30,
+                stream=True
             )
 
-            if download_response.status_code != 200:
-                print(f"⚠️  Download failed: {download_response.status_code}")
-                print(f"⚠️  Download response: {download_response.text[:200]}")
-                return None
-
-            # The file is typically gzipped
-            try:
-                content = gzip.decompress(download_response.content)
-            except:
-                # If not gzipped, use as-is
-                content = download_response.content
-
-            print(f"✅ Subtitle downloaded ({len(content)} bytes)")
+            with download_response:
+                if download_response.status_code != 200:
+                    logger.warning(
+                        "Download failed: %s - %s",
+                        download_response.status_code, download_response.text[:200]
+                    )
+                    return None
+
+                # Decode transfer encoding on the fly and peek at the gzip magic
+                raw = download_response.raw
+                raw.decode_content = True
+                stream = io.BufferedReader(raw)
+
+                # The file is typically gzipped; decompress while reading
+                if stream.peek(2)[:2] == _GZIP_MAGIC:
+                    with gzip.GzipFile(fileobj=stream) as gz:
+                        content = gz.read()
+                else:
+                    content = stream.read()
+
+            logger.info("Subtitle downloaded (%d bytes)", len(content))
             return content
 
         except Exception as e:
-            print(f"❌ Error downloading subtitle: {e}")
+            logger.error("Error downloading subtitle: %s", e)
             return None
 
     @staticmethod
@@ -348,36 +555,27 @@ class SubtitleService:
             Hash string or None
         """
         try:
-            longlongformat = 'q'  # long long
-            bytesize = 8  # 8 bytes = 64 bits
-
             filesize = video_path.stat().st_size
 
-            if filesize < 65536 * 2:
+            if filesize < _HASH_CHUNK_SIZE * 2:
                 return None
 
-            hash_value = filesize
-
-            with open(video_path, 'rb') as f:
-                # Read first 64kb
-                for _ in range(65536 // bytesize):
-                    buffer = f.read(bytesize)
-                    (l_value,) = __import__('struct').unpack(longlongformat, buffer)
-                    hash_value += l_value
-                    hash_value &= 0xFFFFFFFFFFFFFFFF  # Stay as 64-bit
+            # Read first and last 64kb with two positional reads
+            fd = os.open(video_path, os.O_RDONLY)
+            try:
+                head = os.pread(fd, _HASH_CHUNK_SIZE, 0)
+                tail = os.pread(fd, _HASH_CHUNK_SIZE, filesize - _HASH_CHUNK_SIZE)
+            finally:
+                os.close(fd)
 
-                # Read last 64kb
-                f.seek(max(0, filesize - 65536), 0)
-                for _ in range(65536 // bytesize):
-                    buffer = f.read(bytesize)
-                    (l_value,) = __import__('struct').unpack(longlongformat, buffer)
-                    hash_value += l_value
-                    hash_value &= 0xFFFFFFFFFFFFFFFF
+            # Sum both chunks as 64-bit little-endian words, wrapping at 64 bits
+            hash_value = filesize + sum(_HASH_STRUCT.unpack(head)) + sum(_HASH_STRUCT.unpack(tail))
+            hash_value &= 0xFFFFFFFFFFFFFFFF
 
             return "%016x" % hash_value
 
         except Exception as e:
-            print(f"❌ Error calculating hash: {e}")
+            logger.error("Error calculating hash: %s", e)
             return None
 
     def quick_search(self, filename: str, language: str = 'pt', limit: int = 10) -> List[Dict[str, Any]]:
@@ -393,18 +591,14 @@ class SubtitleService:
             List of subtitle results
         """
         # Parse filename to extract movie name
-        from pathlib import Path
-        import re
-
         basename = Path(filename).stem
 
         # Remove common tags
-        clean_name = re.sub(r'[\.\-_]', ' ', basename)
-        clean_name = re.sub(r'\b(1080p|720p|480p|2160p|4K|BluRay|WEB-DL|WEBRip|HDTV|DVDRip|BRRip|x264|x265|HEVC|AAC|AC3|DTS|YIFY|RARBG|AMZN)\b', '', clean_name, flags=re.IGNORECASE)
-        clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+        clean_name = _QUICK_RE.sub(lambda m: ' ' if m.group('sep') else '', basename)
+        clean_name = ' '.join(clean_name.split())
 
         # Extract year if present
-        year_match = re.search(r'\b(19|20)\d{2}\b', clean_name)
+        year_match = _YEAR_RE.search(clean_name)
         if year_match:
             year = year_match.group(0)
             clean_name = clean_name.replace(year, '').strip()
@@ -412,6 +606,6 @@ class SubtitleService:
         else:
             query = clean_name
 
-        print(f"🔍 Quick search for: {query}")
+        logger.info("Quick search for: %s", query)
 
         return self.search_by_query(query, language, limit)
@@ -2,28 +2,68 @@
 Translation service
 Handles subtitle translation using Google Gemini API with existing translate.py module
 """
+import os
+import random
+import re
+import sqlite3
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Callable, Tuple
 import time
 
+import requests
+
+from ..constants import (
+    TRANSLATION_CONCURRENCY,
+    TRANSLATION_CACHE_MAX_AGE_DAYS,
+    TRANSLATION_BATCH_MAX_TOKENS,
+    TRANSLATION_BATCH_API_MIN_ENTRIES,
+    TRANSLATION_BATCH_API_POLL_SECONDS,
+    TRANSLATION_BATCH_API_TIMEOUT_SECONDS
+)
+from ..utils.translation_cache import TranslationCache
+
 # Import existing translation module (now in utils)
-from ..utils.translation_utils import SRTParser, GeminiTranslator, SubtitleValidator, Subtitle
+from ..utils.translation_utils import SRTParser, GeminiTranslator, GeminiAPIError, SubtitleValidator, Subtitle
+
+# Entries without any letter (punctuation, "♪ ♪", numbers) are not translated
+_LETTER_RE = re.compile(r'[^\W\d_]')
+
+
+def _dedup_key(text: str) -> str:
+    """
+    Key under which repeated lines share one translation
+
+    Lines that differ only in spacing or where they break are the same line
+    once the formatter reflows them; casing and punctuation are kept because
+    they change the translation ("Yes." vs "Yes?").
+    """
+    return ' '.join(text.split())
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed Gemini call may succeed if repeated (429, 5xx, timeout)"""
+    if isinstance(error, GeminiAPIError):
+        return error.retryable
+    return isinstance(error, requests.Timeout)
 
 
 class TranslationService:
     """Service for subtitle translation"""
 
-    def __init__(self, api_key: str, batch_size: int = 10):
+    def __init__(self, api_key: str, batch_size: int = 10, cache_path: Optional[Path] = None):
         """
         Initialize translation service
 
         Args:
             api_key: Google Gemini API key
             batch_size: Number of subtitles per batch
+            cache_path: Optional SQLite file for the persistent translation cache
         """
         self.api_key = api_key
         self.batch_size = batch_size
         self.validator = SubtitleValidator()
+        self.cache = self._open_cache(cache_path) if cache_path else None
         # Translator will be created with specific languages when translate_file is called
         self.translator = None
 
@@ -45,7 +85,8 @@ class TranslationService:
             source_lang: Source language code (en, pt)
             target_lang: Target language code (en, pt)
             movie_context: Optional movie name for context
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback for progress updates; without one,
+                large files are translated through the Gemini Batch API
 
         Returns:
             True if successful
@@ -71,11 +112,10 @@ class TranslationService:
                 print(f"   Context: {movie_context}")
             print(f"{'='*70}\n")
 
-            # Parse original subtitles
+            # Parse original subtitles line by line (no full-file string)
             with open(input_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                original_subs = list(SRTParser.iter_parse_file(f))
 
-            original_subs = SRTParser.parse(content)
             total_entries = len(original_subs)
             print(f"📝 Parsed {total_entries} subtitle entries")
 
@@ -88,57 +128,141 @@ class TranslationService:
                     'message': f'Parsed {total_entries} entries'
                 })
 
-            # Translate in batches
-            translated_subs = []
-            total_batches = (len(original_subs) + self.batch_size - 1) // self.batch_size
+            # Only unique texts with letters go to Gemini; repeated lines reuse
+            # the first translation and punctuation/music-only lines pass through
+            translations: Dict[str, str] = {}  # _dedup_key(text) -> translation
+            novel_subs = []
+            seen = set()
+            for sub in original_subs:
+                key = _dedup_key(sub.text)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if _LETTER_RE.search(key):
+                    novel_subs.append(sub)
+
+            if total_entries:
+                print(
+                    f"♻️  {len(seen)} unique texts in {total_entries} entries "
+                    f"({1 - len(seen) / total_entries:.0%} duplicates)"
+                )
+
+            # Lines translated in earlier runs come from the persistent cache
+            if self.cache and novel_subs:
+                try:
+                    cached = self.cache.get_many(
+                        source_lang, target_lang, [sub.text for sub in novel_subs]
+                    )
+                except sqlite3.Error as e:
+                    print(f"⚠️  Translation cache lookup failed: {e}")
+                    cached = {}
+                if cached:
+                    for text, translated in cached.items():
+                        translations[_dedup_key(text)] = translated
+                    novel_subs = [sub for sub in novel_subs if sub.text not in cached]
+                    print(f"💾 {len(cached)} lines served from translation cache")
+
+            skipped = total_entries - len(novel_subs)
+            if skipped:
+                print(f"♻️  Skipping {skipped} duplicate/untranslatable entries")
+
+            # Translate batches concurrently, packed by estimated token count
+            batches = self._pack_batches(novel_subs, TRANSLATION_BATCH_MAX_TOKENS, self.batch_size)
+            total_batches = len(batches)
             recent_translations = []  # Store last 5 translations
+            completed_batches = 0
+            failed_entries = 0
+            current_entry = skipped
+
+            # Large non-interactive jobs go through the Batch API (cheaper, no
+            # per-minute limits); batches it could not translate fall through
+            # to the interactive requests below
+            if progress_callback is None and len(novel_subs) >= TRANSLATION_BATCH_API_MIN_ENTRIES:
+                batches = self._translate_with_batch_api(batches, translations)
+                current_entry = total_entries - sum(len(batch) for batch in batches)
+                total_batches = len(batches)
+
+            print(f"🔄 Dispatching {total_batches} batches ({TRANSLATION_CONCURRENCY} concurrent)...")
+
+            workers = max(1, min(TRANSLATION_CONCURRENCY, total_batches))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._translate_batch_with_retry, batch, batch_num): batch_num
+                    for batch_num, batch in enumerate(batches)
+                }
+
+                for future in as_completed(futures):
+                    batch_num = futures[future]
+                    batch = batches[batch_num]
+                    try:
+                        translated_batch, batch_time, batch_failed = future.result()
+                    except Exception:
+                        # Non-transient error: don't send the queued batches too
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    failed_entries += batch_failed
+                    for orig, trans in zip(batch, translated_batch):
+                        translations[_dedup_key(orig.text)] = trans.text
+
+                    # Calculate progress metrics
+                    completed_batches += 1
+                    current_entry += len(translated_batch)
+                    percentage = int((current_entry / total_entries) * 100)
+
+                    # Calculate speed (entries per second)
+                    elapsed_time = time.time() - start_time
+                    speed = current_entry / elapsed_time if elapsed_time > 0 else 0
+
+                    # Estimate time remaining
+                    remaining_entries = total_entries - current_entry
+                    eta_seconds = remaining_entries / speed if speed > 0 else 0
+
+                    # Store recent translations (last 5)
+                    for orig, trans in zip(batch, translated_batch):
+                        recent_translations.append({
+                            'original': orig.text,
+                            'translated': trans.text
+                        })
+                    recent_translations = recent_translations[-5:]  # Keep only last 5
+
+                    print(f"✅ Batch {batch_num + 1} complete ({batch_time:.1f}s)")
+
+                    if progress_callback:
+                        progress_callback({
+                            'status': 'translating',
+                            'total_entries': total_entries,
+                            'current_entry': current_entry,
+                            'percentage': percentage,
+                            'speed': round(speed, 2),
+                            'eta_seconds': int(eta_seconds),
+                            'recent_translations': recent_translations,
+                            'failed_entries': failed_entries,
+                            'message': f'Batch {completed_batches}/{total_batches} complete'
+                        })
+
+            # Isolated failures are tolerated; a run where nothing translated is not
+            if novel_subs and failed_entries == len(novel_subs):
+                raise Exception("All translation requests failed")
+            if failed_entries:
+                print(f"⚠️  {failed_entries} entries kept their original text")
+
+            translated_subs = [
+                Subtitle(sub.id, sub.timeframe, translations.get(_dedup_key(sub.text), sub.text))
+                for sub in original_subs
+            ]
 
-            for batch_num in range(total_batches):
-                batch_start_time = time.time()
-                start_idx = batch_num * self.batch_size
-                end_idx = min(start_idx + self.batch_size, len(original_subs))
-                batch = original_subs[start_idx:end_idx]
-
-                print(f"🔄 Processing batch {batch_num + 1}/{total_batches} ({len(batch)} items)...")
-
-                # Translate batch (GeminiTranslator expects Subtitle objects)
-                translated_batch = self.translator._translate_texts(batch)
-                translated_subs.extend(translated_batch)
-
-                # Calculate progress metrics
-                batch_time = time.time() - batch_start_time
-                current_entry = len(translated_subs)
-                percentage = int((current_entry / total_entries) * 100)
-
-                # Calculate speed (entries per second)
-                elapsed_time = time.time() - start_time
-                speed = current_entry / elapsed_time if elapsed_time > 0 else 0
-
-                # Estimate time remaining
-                remaining_entries = total_entries - current_entry
-                eta_seconds = remaining_entries / speed if speed > 0 else 0
-
-                # Store recent translations (last 5)
-                for orig, trans in zip(batch, translated_batch):
-                    recent_translations.append({
-                        'original': orig.text,
-                        'translated': trans.text
-                    })
-                recent_translations = recent_translations[-5:]  # Keep only last 5
-
-                print(f"✅ Batch {batch_num + 1} complete ({batch_time:.1f}s)")
-
-                if progress_callback:
-                    progress_callback({
-                        'status': 'translating',
-                        'total_entries': total_entries,
-                        'current_entry': current_entry,
-                        'percentage': percentage,
-                        'speed': round(speed, 2),
-                        'eta_seconds': int(eta_seconds),
-                        'recent_translations': recent_translations,
-                        'message': f'Batch {batch_num + 1}/{total_batches} complete'
-                    })
+            # Persist new translations; untranslated fallbacks are not cached
+            if self.cache and novel_subs:
+                try:
+                    pairs = []
+                    for sub in novel_subs:
+                        translated = translations.get(_dedup_key(sub.text), sub.text)
+                        if translated != sub.text:
+                            pairs.append((sub.text, translated))
+                    self.cache.put_many(source_lang, target_lang, pairs)
+                except sqlite3.Error as e:
+                    print(f"⚠️  Translation cache write failed: {e}")
 
             # Validate and fix line breaks
             print("\n🔍 Validating translations...")
@@ -154,14 +278,19 @@ class TranslationService:
 
             if issues['line_rule_violations']:
                 print("⚠️  Line rule violations detected, applying fixes...")
-                translated_subs = self.validator.fix_line_breaks(original_subs, translated_subs)
+                translated_subs = self.validator.fix_line_breaks(original_subs, translated_subs, issues)
                 print("✅ Fixes applied")
 
-            # Generate output file
-            output_content = SRTParser.generate(translated_subs)
-
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(output_content)
+            # Write output file entry by entry into a temp file, then swap it
+            # in so a crash never leaves a truncated SRT at output_path
+            tmp_path = output_path.with_name(output_path.name + '.tmp')
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    SRTParser.write(translated_subs, f)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
 
             total_time = time.time() - start_time
 
@@ -195,6 +324,151 @@ class TranslationService:
 
             return False
 
+    @staticmethod
+    def _pack_batches(subs: List[Subtitle], max_tokens: int, max_items: int) -> List[List[Subtitle]]:
+        """
+        Greedily pack subtitles into batches under a token budget
+
+        Short lines share a request instead of padding out a fixed-size batch,
+        while long lines close a batch early to stay clear of output limits.
+        Tokens are estimated as len(text) // 4.
+
+        Args:
+            subs: Subtitles to translate, in order
+            max_tokens: Estimated token budget per batch
+            max_items: Maximum subtitles per batch
+
+        Returns:
+            List of batches preserving subtitle order
+        """
+        batches = []
+        batch = []
+        tokens = 0
+
+        for sub in subs:
+            sub_tokens = len(sub.text) // 4 + 1
+            if batch and (tokens + sub_tokens > max_tokens or len(batch) >= max_items):
+                batches.append(batch)
+                batch = []
+                tokens = 0
+            batch.append(sub)
+            tokens += sub_tokens
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _translate_with_batch_api(
+        self,
+        batches: List[List[Subtitle]],
+        translations: Dict[str, str]
+    ) -> List[List[Subtitle]]:
+        """
+        Translate batches with one Gemini Batch API job, blocking until it ends
+
+        Args:
+            batches: Batches to translate
+            translations: Dedup key -> translation map, updated in place
+
+        Returns:
+            Batches the job did not translate (all of them if it failed)
+        """
+        try:
+            job_name = self.translator.submit_batch_job(batches)
+            print(f"📦 Submitted {len(batches)} batches as Batch API job {job_name}")
+
+            deadline = time.time() + TRANSLATION_BATCH_API_TIMEOUT_SECONDS
+            while True:
+                job = self.translator.get_batch_job(job_name)
+                state = self.translator.batch_job_state(job)
+                if state not in ('BATCH_STATE_PENDING', 'BATCH_STATE_RUNNING'):
+                    break
+                if time.time() > deadline:
+                    print(f"⚠️  Batch API job {job_name} timed out")
+                    return batches
+                time.sleep(TRANSLATION_BATCH_API_POLL_SECONDS)
+
+            if state != 'BATCH_STATE_SUCCEEDED':
+                print(f"⚠️  Batch API job {job_name} ended as {state}")
+                return batches
+
+            results = self.translator.parse_batch_results(job, batches)
+        except Exception as e:
+            print(f"⚠️  Batch API unavailable, using interactive requests: {e}")
+            return batches
+
+        remaining = []
+        for batch, translated_batch in zip(batches, results):
+            if translated_batch is None:
+                remaining.append(batch)
+                continue
+            for orig, trans in zip(batch, translated_batch):
+                translations[_dedup_key(orig.text)] = trans.text
+
+        print(f"📦 Batch API translated {len(batches) - len(remaining)}/{len(batches)} batches")
+        return remaining
+
+    @staticmethod
+    def _open_cache(cache_path: Path) -> Optional[TranslationCache]:
+        """Open the persistent translation cache; translation works without it"""
+        try:
+            return TranslationCache(cache_path, max_age_days=TRANSLATION_CACHE_MAX_AGE_DAYS)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️  Translation cache disabled: {e}")
+            return None
+
+    def _translate_batch_with_retry(
+        self,
+        batch: List[Subtitle],
+        batch_num: int,
+        attempts: Optional[int] = None
+    ) -> Tuple[List[Subtitle], float, int]:
+        """
+        Translate one batch, retrying with backoff and isolating bad entries
+
+        Concurrent batches make rate-limit errors likely, so a batch that
+        hits a transient error (429, 5xx, timeout) waits
+        min(retry_delay * 2^attempt + jitter, 30s) before trying again.
+        If it still fails, the batch is split in half and each half retried,
+        down to single entries, which keep their original text. Any other
+        error (bad key, denied quota, malformed request) is raised at once.
+
+        Args:
+            batch: Subtitles to translate
+            batch_num: Zero-based batch index (for logging)
+            attempts: Tries before splitting (default: translator.max_retries)
+
+        Returns:
+            Tuple of (translated subtitles, seconds taken, entries left untranslated)
+        """
+        batch_start_time = time.time()
+        attempts = attempts or self.translator.max_retries
+        error = None
+
+        for attempt in range(attempts):
+            try:
+                translated_batch = self.translator._translate_texts(batch)
+                return translated_batch, time.time() - batch_start_time, 0
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                error = e
+                if attempt < attempts - 1:
+                    delay = min(self.translator.retry_delay * (2 ** attempt) + random.random(), 30)
+                    print(f"⚠️  Batch {batch_num + 1} failed ({e}), retrying in {delay:.1f}s...")
+                    time.sleep(delay)
+
+        if len(batch) == 1:
+            print(f"⚠️  Entry {batch[0].id} left untranslated: {error}")
+            return [Subtitle(batch[0].id, batch[0].timeframe, batch[0].text)], time.time() - batch_start_time, 1
+
+        # Halves get fewer tries: the full batch already exhausted the backoff
+        mid = len(batch) // 2
+        print(f"⚠️  Batch {batch_num + 1} failed after {attempts} attempts, splitting {len(batch)} entries")
+        left, _, left_failed = self._translate_batch_with_retry(batch[:mid], batch_num, attempts=2)
+        right, _, right_failed = self._translate_batch_with_retry(batch[mid:], batch_num, attempts=2)
+        return left + right, time.time() - batch_start_time, left_failed + right_failed
+
     def translate_text(
         self,
         texts: List[str],
@@ -240,6 +514,16 @@ class TranslationService:
         """Validate if language is supported"""
         return lang in TranslationService.get_supported_languages()
 
+    @staticmethod
+    def _count_text(subs: List[Dict]) -> Tuple[int, int]:
+        """Count characters and words of subtitle texts in a single pass"""
+        chars = words = 0
+        for sub in subs:
+            text = sub.text
+            chars += len(text)
+            words += len(text.split())
+        return chars, words
+
     def get_stats(self, original_subs: List[Dict], translated_subs: List[Dict]) -> Dict[str, Any]:
         """
         Get translation statistics
@@ -251,11 +535,8 @@ class TranslationService:
         Returns:
             Statistics dictionary
         """
-        original_chars = sum(len(sub.text) for sub in original_subs)
-        translated_chars = sum(len(sub.text) for sub in translated_subs)
-
-        original_words = sum(len(sub.text.split()) for sub in original_subs)
-        translated_words = sum(len(sub.text.split()) for sub in translated_subs)
+        original_chars, original_words = self._count_text(original_subs)
+        translated_chars, translated_words = self._count_text(translated_subs)
 
         return {
             'total_entries': len(translated_subs),
@@ -4,8 +4,193 @@ Handles video analysis, conversion, and remuxing operations
 """
 import subprocess
 import json
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List
+
+
+@lru_cache(maxsize=128)
+def _ffprobe_json(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Run ffprobe once per file version (mtime/size only key the cache)"""
+    result = subprocess.run([
+        'ffprobe', '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_format',
+        '-show_streams',
+        path
+    ], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def _probe(video_path: Path) -> Dict[str, Any]:
+    """
+    Cached ffprobe streams/format for a file
+
+    Shared by get_video_info, can_remux_to_mp4 and extract_mkv_subtitles so
+    an analyze-then-remux flow probes each file once. The returned dict is
+    shared; callers must not mutate it.
+    """
+    stat = Path(video_path).stat()
+    return _ffprobe_json(str(video_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _run_ffmpeg(
+    cmd: List[str],
+    duration: float = 0,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    cancel_event: Optional[threading.Event] = None
+) -> bool:
+    """
+    Run ffmpeg streaming its -progress output instead of buffering stderr
+
+    Only the last stderr lines are kept for error reporting, so memory stays
+    bounded on multi-hour jobs. ffmpeg emits a progress block about twice a
+    second; cancel_event is checked on each one and terminates the process.
+
+    Args:
+        cmd: ffmpeg command (without -progress flags)
+        duration: Input duration in seconds, used for the percentage
+        progress_callback: Optional callback receiving progress dicts
+        cancel_event: Optional event that aborts the run when set
+
+    Returns:
+        True if ffmpeg finished, False if cancelled
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg exits with an error
+    """
+    process = subprocess.Popen(
+        cmd[:1] + ['-progress', 'pipe:2', '-nostats'] + cmd[1:],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors='replace'
+    )
+    stderr_tail = deque(maxlen=20)
+    block = {}
+
+    try:
+        for line in process.stderr:
+            key, sep, value = line.strip().partition('=')
+            if not sep or ' ' in key:
+                stderr_tail.append(line)
+                continue
+
+            block[key] = value
+            if key != 'progress':
+                continue
+
+            # A "progress=" line closes one key=value block
+            if cancel_event is not None and cancel_event.is_set():
+                process.terminate()
+                process.wait()
+                print("⏹️  ffmpeg cancelled")
+                return False
+
+            if progress_callback:
+                try:
+                    out_time = int(block.get('out_time_us', 0)) / 1_000_000
+                except ValueError:
+                    out_time = 0
+                percentage = min(99, int(out_time / duration * 100)) if duration > 0 else 0
+                if value == 'end':
+                    percentage = 100
+                progress_callback({
+                    'status': 'processing',
+                    'percentage': percentage,
+                    'fps': block.get('fps', '0'),
+                    'speed': block.get('speed', 'N/A').strip(),
+                    'message': f'Processing: {percentage}%'
+                })
+            block = {}
+
+        return_code = process.wait()
+        if return_code != 0:
+            raise subprocess.CalledProcessError(return_code, cmd, stderr=''.join(stderr_tail))
+        return True
+
+    finally:
+        if process.poll() is None:
+            process.terminate()
+            process.wait()
+        process.stderr.close()
+
+
+# H.264 encoders in preference order; libx264 is the CPU fallback
+_HW_ENCODERS = ('h264_nvenc', 'h264_videotoolbox', 'h264_qsv', 'h264_amf')
+
+# Per-encoder quality flags for the fast/balanced/high presets
+_ENCODER_PRESETS = {
+    'libx264': {
+        'fast': ['-crf', '28', '-preset', 'veryfast'],
+        'balanced': ['-crf', '23', '-preset', 'medium'],
+        'high': ['-crf', '18', '-preset', 'slow'],
+    },
+    'h264_nvenc': {
+        'fast': ['-preset', 'p2', '-rc', 'vbr', '-cq', '28', '-b:v', '0'],
+        'balanced': ['-preset', 'p4', '-rc', 'vbr', '-cq', '23', '-b:v', '0'],
+        'high': ['-preset', 'p6', '-rc', 'vbr', '-cq', '19', '-b:v', '0'],
+    },
+    'h264_videotoolbox': {
+        'fast': ['-q:v', '50'],
+        'balanced': ['-q:v', '60'],
+        'high': ['-q:v', '70'],
+    },
+    'h264_qsv': {
+        'fast': ['-preset', 'veryfast', '-global_quality', '28'],
+        'balanced': ['-preset', 'medium', '-global_quality', '23'],
+        'high': ['-preset', 'slow', '-global_quality', '19'],
+    },
+    'h264_amf': {
+        'fast': ['-quality', 'speed', '-rc', 'cqp', '-qp_i', '28', '-qp_p', '28'],
+        'balanced': ['-quality', 'balanced', '-rc', 'cqp', '-qp_i', '23', '-qp_p', '23'],
+        'high': ['-quality', 'quality', '-rc', 'cqp', '-qp_i', '19', '-qp_p', '19'],
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """
+    First hardware H.264 encoder that actually works on this machine
+
+    Builds often list nvenc/qsv/amf without the device being present, so each
+    candidate from 'ffmpeg -encoders' is confirmed with a one-frame test
+    encode. Runs once per process.
+    """
+    try:
+        listing = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True, text=True, check=True
+        ).stdout
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+    for encoder in _HW_ENCODERS:
+        if f" {encoder} " not in listing:
+            continue
+        try:
+            subprocess.run([
+                'ffmpeg', '-hide_banner', '-v', 'error',
+                '-f', 'lavfi', '-i', 'color=size=256x256:duration=0.1',
+                '-frames:v', '1', '-c:v', encoder, '-f', 'null', '-'
+            ], capture_output=True, check=True, timeout=15)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            continue
+        print(f"🚀 Using hardware encoder: {encoder}")
+        return encoder
+    return None
+
+
+def _probe_duration(video_path: Path) -> float:
+    """Duration in seconds from the cached probe, 0 if unknown"""
+    try:
+        return float(_probe(video_path).get('format', {}).get('duration', 0))
+    except (subprocess.CalledProcessError, OSError, ValueError):
+        return 0
 
 
 class VideoService:
@@ -23,15 +208,7 @@ class VideoService:
             Dictionary containing video metadata
         """
         try:
-            result = subprocess.run([
-                'ffprobe', '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_format',
-                '-show_streams',
-                str(video_path)
-            ], capture_output=True, text=True, check=True)
-
-            data = json.loads(result.stdout)
+            data = _probe(video_path)
             format_info = data.get('format', {})
             video_stream = next(
                 (s for s in data.get('streams', []) if s.get('codec_type') == 'video'),
@@ -105,14 +282,7 @@ class VideoService:
             True if remuxing is possible
         """
         try:
-            result = subprocess.run([
-                'ffprobe', '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_streams',
-                str(video_path)
-            ], capture_output=True, text=True, check=True)
-
-            data = json.loads(result.stdout)
+            data = _probe(video_path)
 
             video_stream = next(
                 (s for s in data.get('streams', []) if s.get('codec_type') == 'video'),
@@ -144,13 +314,20 @@ class VideoService:
             return False
 
     @staticmethod
-    def remux_to_mp4(input_path: Path, output_path: Path) -> bool:
+    def remux_to_mp4(
+        input_path: Path,
+        output_path: Path,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> bool:
         """
         Remux video to MP4 (fast, no re-encoding)
 
         Args:
             input_path: Input video file
             output_path: Output MP4 file
+            progress_callback: Optional callback for progress updates
+            cancel_event: Optional event that aborts the remux when set
 
         Returns:
             True if successful
@@ -158,23 +335,31 @@ class VideoService:
         try:
             print(f"⚡ Remuxing {input_path.name} to MP4...")
 
-            subprocess.run([
+            finished = _run_ffmpeg([
                 'ffmpeg', '-y',
                 '-i', str(input_path),
                 '-c', 'copy',  # Copy streams without re-encoding
                 '-movflags', '+faststart',  # Optimize for web streaming
                 str(output_path)
-            ], check=True, capture_output=True)
+            ], _probe_duration(input_path), progress_callback, cancel_event)
+
+            if not finished:
+                return False
 
             print(f"✅ Remux complete: {output_path.name}")
             return True
 
         except subprocess.CalledProcessError as e:
-            print(f"❌ Remux failed: {e.stderr.decode()}")
+            print(f"❌ Remux failed: {e.stderr}")
             return False
 
     @staticmethod
-    def convert_to_mp4(input_path: Path, output_path: Path, quality: str = 'balanced') -> bool:
+    def convert_to_mp4(
+        input_path: Path,
+        output_path: Path,
+        quality: str = 'balanced',
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> bool:
         """
         Convert video to MP4 with re-encoding
 
@@ -182,41 +367,61 @@ class VideoService:
             input_path: Input video file
             output_path: Output MP4 file
             quality: Conversion quality (fast, balanced, high)
+            progress_callback: Optional callback for progress updates
 
         Returns:
             True if successful
         """
-        # Quality presets
-        presets = {
-            'fast': {'crf': '28', 'preset': 'veryfast'},
-            'balanced': {'crf': '23', 'preset': 'medium'},
-            'high': {'crf': '18', 'preset': 'slow'}
-        }
+        if quality not in _ENCODER_PRESETS['libx264']:
+            quality = 'balanced'
 
-        settings = presets.get(quality, presets['balanced'])
+        encoder = _detect_hw_encoder()
+        if encoder:
+            try:
+                return VideoService._encode_mp4(
+                    input_path, output_path, quality, encoder, progress_callback
+                )
+            except subprocess.CalledProcessError as e:
+                print(f"⚠️  {encoder} failed, falling back to libx264: {e.stderr}")
 
         try:
-            print(f"🎬 Converting {input_path.name} to MP4 (quality: {quality})...")
-
-            subprocess.run([
-                'ffmpeg', '-y',
-                '-i', str(input_path),
-                '-c:v', 'libx264',
-                '-crf', settings['crf'],
-                '-preset', settings['preset'],
-                '-c:a', 'aac',
-                '-b:a', '192k',
-                '-movflags', '+faststart',
-                str(output_path)
-            ], check=True, capture_output=True)
-
-            print(f"✅ Conversion complete: {output_path.name}")
-            return True
-
+            return VideoService._encode_mp4(
+                input_path, output_path, quality, 'libx264', progress_callback
+            )
         except subprocess.CalledProcessError as e:
-            print(f"❌ Conversion failed: {e.stderr.decode()}")
+            print(f"❌ Conversion failed: {e.stderr}")
             return False
 
+    @staticmethod
+    def _encode_mp4(
+        input_path: Path,
+        output_path: Path,
+        quality: str,
+        encoder: str,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> bool:
+        """Run one MP4 encode with the given H.264 encoder; raises on ffmpeg errors"""
+        # Hardware encoders also decode on the device when possible
+        hwaccel = ['-hwaccel', 'auto'] if encoder != 'libx264' else []
+
+        print(f"🎬 Converting {input_path.name} to MP4 (quality: {quality}, encoder: {encoder})...")
+
+        finished = _run_ffmpeg([
+            'ffmpeg', '-y',
+            *hwaccel,
+            '-i', str(input_path),
+            '-c:v', encoder,
+            *_ENCODER_PRESETS[encoder][quality],
+            '-c:a', 'aac',
+            '-b:a', '192k',
+            '-movflags', '+faststart',
+            str(output_path)
+        ], _probe_duration(input_path), progress_callback)
+
+        if finished:
+            print(f"✅ Conversion complete: {output_path.name}")
+        return finished
+
     @staticmethod
     def extract_mkv_subtitles(video_path: Path, output_dir: Path) -> list:
         """
@@ -231,24 +436,16 @@ class VideoService:
         """
         try:
             # Get subtitle tracks info
-            result = subprocess.run([
-                'ffprobe', '-v', 'quiet',
-                '-print_format', 'json',
-                '-show_streams',
-                '-select_streams', 's',
-                str(video_path)
-            ], capture_output=True, text=True, check=True)
-
-            data = json.loads(result.stdout)
-            subtitle_streams = data.get('streams', [])
+            subtitle_streams = [
+                stream for stream in _probe(video_path).get('streams', [])
+                if stream.get('codec_type') == 'subtitle'
+            ]
 
             if not subtitle_streams:
                 return []
 
-            extracted = []
-
+            tracks = []
             for idx, stream in enumerate(subtitle_streams):
-                stream_index = stream.get('index')
                 codec = stream.get('codec_name', 'unknown')
                 language = stream.get('tags', {}).get('language', 'unknown')
                 title = stream.get('tags', {}).get('title', f'Track {idx + 1}')
@@ -256,32 +453,64 @@ class VideoService:
                 # Determine file extension based on codec
                 ext = 'srt' if codec == 'subrip' else codec
 
-                output_file = output_dir / f"subtitle_{idx}_{language}.{ext}"
+                tracks.append({
+                    'index': idx,
+                    'stream_index': stream.get('index'),
+                    'language': language,
+                    'title': title,
+                    'codec': codec,
+                    'output_file': output_dir / f"subtitle_{idx}_{language}.{ext}"
+                })
 
-                try:
-                    # Extract subtitle
-                    subprocess.run([
-                        'ffmpeg', '-y',
-                        '-i', str(video_path),
-                        '-map', f'0:{stream_index}',
-                        str(output_file)
-                    ], check=True, capture_output=True)
-
-                    extracted.append({
-                        'index': idx,
-                        'language': language,
-                        'title': title,
-                        'codec': codec,
-                        'file_path': str(output_file),
-                        'file_name': output_file.name
-                    })
-
-                except subprocess.CalledProcessError:
-                    print(f"⚠️  Failed to extract subtitle track {idx}")
+            # All tracks in one demux pass: one -map/output pair per track
+            cmd = ['ffmpeg', '-y', '-i', str(video_path)]
+            for track in tracks:
+                cmd += ['-map', f"0:{track['stream_index']}", str(track['output_file'])]
+
+            try:
+                _run_ffmpeg(cmd)
+                succeeded = [True] * len(tracks)
+            except subprocess.CalledProcessError:
+                # One unsupported track fails the whole command; retry per track
+                # concurrently so the others are still extracted
+                with ThreadPoolExecutor(max_workers=min(8, len(tracks))) as executor:
+                    succeeded = list(executor.map(
+                        lambda track: VideoService._extract_subtitle_track(video_path, track),
+                        tracks
+                    ))
+
+            extracted = []
+            for track, ok in zip(tracks, succeeded):
+                if not ok:
+                    print(f"⚠️  Failed to extract subtitle track {track['index']}")
                     continue
 
+                output_file = track['output_file']
+                extracted.append({
+                    'index': track['index'],
+                    'language': track['language'],
+                    'title': track['title'],
+                    'codec': track['codec'],
+                    'file_path': str(output_file),
+                    'file_name': output_file.name
+                })
+
             return extracted
 
         except Exception as e:
             print(f"❌ Error extracting MKV subtitles: {e}")
             return []
+
+    @staticmethod
+    def _extract_subtitle_track(video_path: Path, track: Dict[str, Any]) -> bool:
+        """Extract a single subtitle track; returns False if ffmpeg fails"""
+        try:
+            subprocess.run([
+                'ffmpeg', '-y',
+                '-i', str(video_path),
+                '-map', f"0:{track['stream_index']}",
+                str(track['output_file'])
+            ], check=True, capture_output=True)
+            return True
+        except subprocess.CalledProcessError:
+            return False
@@ -3,10 +3,10 @@ Automatic file cleanup manager.
 Removes old uploaded files to prevent disk space issues.
 """
 
+import os
 from pathlib import Path
 from datetime import datetime, timedelta
 import threading
-import time
 from typing import Optional
 from .logger import setup_logger
 
@@ -40,6 +40,7 @@ class FileCleanupManager:
         self.max_age = timedelta(hours=max_age_hours)
         self.running = False
         self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
         logger.info(f"FileCleanupManager initialized for {upload_folder}")
         logger.info(f"Files older than {max_age_hours} hours will be deleted")
@@ -66,37 +67,37 @@ class FileCleanupManager:
         logger.debug(f"Starting cleanup scan of {self.upload_folder}")
 
         try:
-            for file_path in self.upload_folder.glob('*'):
-                if not file_path.is_file():
-                    continue
-
+            for entry in self._scan_files():
                 try:
-                    # Get file modification time
-                    file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                    file_age = now - file_mtime
+                    # One stat per entry (DirEntry caches it) for mtime and size
+                    stat = entry.stat()
+                    file_age = now - datetime.fromtimestamp(stat.st_mtime)
 
                     if file_age > self.max_age:
-                        # Get file size before deletion
-                        file_size = file_path.stat().st_size
+                        file_size = stat.st_size
 
                         # Delete file
-                        file_path.unlink()
+                        os.unlink(entry.path)
 
                         deleted_count += 1
                         total_size_freed += file_size
 
                         logger.info(
-                            f"Deleted old file: {file_path.name} "
+                            f"Deleted old file: {entry.name} "
                             f"(age: {file_age.days}d {file_age.seconds//3600}h, "
                             f"size: {file_size / (1024*1024):.2f}MB)"
                         )
 
+                except FileNotFoundError:
+                    # Removed by someone else between the scan and the unlink
+                    logger.debug(f"Already gone: {entry.name}")
+
                 except PermissionError:
-                    logger.error(f"Permission denied deleting {file_path.name}")
+                    logger.error(f"Permission denied deleting {entry.name}")
                     failed_count += 1
 
                 except Exception as e:
-                    logger.error(f"Failed to delete {file_path.name}: {e}")
+                    logger.error(f"Failed to delete {entry.name}: {e}")
                     failed_count += 1
 
         except Exception as e:
@@ -129,16 +130,18 @@ class FileCleanupManager:
             Number of files deleted
         """
         deleted_count = 0
-
-        for ext in extensions:
-            pattern = f"*.{ext}"
-            for file_path in self.upload_folder.glob(pattern):
-                try:
-                    file_path.unlink()
-                    deleted_count += 1
-                    logger.info(f"Deleted {ext} file: {file_path.name}")
-                except Exception as e:
-                    logger.error(f"Failed to delete {file_path.name}: {e}")
+        suffixes = tuple(f".{ext}" for ext in extensions)
+
+        # Single directory pass matching all extensions
+        for entry in self._scan_files():
+            if not entry.name.endswith(suffixes):
+                continue
+            try:
+                os.unlink(entry.path)
+                deleted_count += 1
+                logger.info(f"Deleted {entry.name.rsplit('.', 1)[-1]} file: {entry.name}")
+            except Exception as e:
+                logger.error(f"Failed to delete {entry.name}: {e}")
 
         return deleted_count
 
@@ -162,14 +165,13 @@ class FileCleanupManager:
         old_files = 0
         now = datetime.now()
 
-        for file_path in self.upload_folder.glob('*'):
-            if file_path.is_file():
-                total_files += 1
-                total_size += file_path.stat().st_size
+        for entry in self._scan_files():
+            stat = entry.stat()
+            total_files += 1
+            total_size += stat.st_size
 
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if (now - file_mtime) > self.max_age:
-                    old_files += 1
+            if (now - datetime.fromtimestamp(stat.st_mtime)) > self.max_age:
+                old_files += 1
 
         return {
             'exists': True,
@@ -180,6 +182,20 @@ class FileCleanupManager:
             'max_age_hours': self.max_age.total_seconds() / 3600
         }
 
+    def _scan_files(self) -> list:
+        """
+        List regular files in the upload folder.
+
+        os.scandir returns DirEntry objects whose file type comes from the
+        directory listing and whose stat() result is cached, instead of one
+        Path object and several stat calls per file.
+
+        Returns:
+            List of os.DirEntry for regular files (symlinks not followed)
+        """
+        with os.scandir(self.upload_folder) as it:
+            return [entry for entry in it if entry.is_file(follow_symlinks=False)]
+
     def start_background_cleanup(self, interval_hours: int = 1) -> None:
         """
         Start background cleanup task.
@@ -192,6 +208,7 @@ class FileCleanupManager:
             return
 
         self.running = True
+        self._stop_event.clear()
         interval_seconds = interval_hours * 3600
 
         def cleanup_loop():
@@ -203,11 +220,9 @@ class FileCleanupManager:
                 except Exception as e:
                     logger.error(f"Error in cleanup loop: {e}", exc_info=True)
 
-                # Sleep in small increments to allow quick shutdown
-                sleep_time = 0
-                while sleep_time < interval_seconds and self.running:
-                    time.sleep(60)  # Sleep 1 minute at a time
-                    sleep_time += 60
+                # Returns immediately when stop() sets the event
+                if self._stop_event.wait(interval_seconds):
+                    break
 
             logger.info("Background cleanup stopped")
 
@@ -223,6 +238,7 @@ class FileCleanupManager:
 
         logger.info("Stopping file cleanup service...")
         self.running = False
+        self._stop_event.set()
 
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5)
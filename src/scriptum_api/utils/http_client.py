@@ -3,21 +3,55 @@ Unified HTTP client for external API requests.
 Consolidates duplicate request patterns with error handling, timeouts, and retries.
 """
 
+import io
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path
 import requests
-from typing import Optional, Dict, Any
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from typing import Optional, Dict, Any, List, BinaryIO, Union, Tuple
 from .logger import setup_logger
 from ..constants import (
     API_TIMEOUT_SHORT,
     API_TIMEOUT_MEDIUM,
     API_TIMEOUT_LONG,
     MAX_RETRIES,
+    CACHE_DURATION_LONG_SEC,
+    RETRY_BACKOFF_BASE_SEC,
+    RETRY_BACKOFF_CAP_SEC,
+    RETRY_AFTER_MAX_SEC,
     HTTP_OK,
-    HTTP_NOT_FOUND
+    HTTP_NOT_MODIFIED,
+    HTTP_NOT_FOUND,
+    HTTP_TOO_MANY_REQUESTS
 )
 
 logger = setup_logger(__name__)
 
 
+def _is_retryable(status_code: int) -> bool:
+    """Only rate limiting and server errors are worth retrying; other 4xx won't change"""
+    return status_code == HTTP_TOO_MANY_REQUESTS or status_code >= 500
+
+
+def _retry_delay(attempt: int, response: Optional[requests.Response] = None) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Honors a numeric Retry-After header, otherwise full-jitter exponential
+    backoff so concurrent clients don't retry in lockstep.
+    """
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return min(float(retry_after), RETRY_AFTER_MAX_SEC)
+    return random.uniform(0, min(RETRY_BACKOFF_CAP_SEC, RETRY_BACKOFF_BASE_SEC * 2 ** attempt))
+
+
 class HTTPClient:
     """
     Unified HTTP client with automatic retries and error handling.
@@ -34,69 +68,158 @@ class HTTPClient:
         >>> result = client.post("https://api.example.com/action", {"key": "value"})
     """
 
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    # get(cache_ttl=...) responses: key -> (json, ETag, Last-Modified, fresh_until).
+    # Entries outlive their freshness so stale ones can be revalidated.
+    _response_cache = TTLCache(maxsize=1024, ttl=CACHE_DURATION_LONG_SEC)
+    _cache_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]]
+    ) -> Tuple:
+        """Request signature; headers are included since they may carry auth"""
+        return (
+            url,
+            tuple(sorted((k, str(v)) for k, v in (headers or {}).items())),
+            tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+        )
+
+    @classmethod
+    def _get_session(cls) -> requests.Session:
+        """
+        Shared session so TCP/TLS connections are reused across calls.
+
+        Adapter retries stay disabled; the retry loops below own retrying.
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+                    session.mount('http://', adapter)
+                    session.mount('https://', adapter)
+                    cls._session = session
+        return cls._session
+
     @staticmethod
     def get(
         url: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
         timeout: int = API_TIMEOUT_SHORT,
-        max_retries: int = MAX_RETRIES
+        max_retries: int = MAX_RETRIES,
+        cache_ttl: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Perform GET request with automatic retries and error handling.
 
+        With cache_ttl, a response is reused without a request for that many
+        seconds; after that it is revalidated with If-None-Match /
+        If-Modified-Since and a 304 keeps the cached body. Cached responses
+        are shared, so callers must not mutate them.
+
         Args:
             url: Target URL
             headers: Optional HTTP headers
             params: Optional query parameters
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            cache_ttl: Optional seconds a response stays fresh in memory
 
         Returns:
             Parsed JSON response or None on failure
         """
+        cache_key = None
+        cached = None
+        request_headers = headers
+        if cache_ttl:
+            cache_key = HTTPClient._cache_key(url, headers, params)
+            with HTTPClient._cache_lock:
+                cached = HTTPClient._response_cache.get(cache_key)
+            if cached is not None:
+                data, etag, last_modified, fresh_until = cached
+                if time.monotonic() < fresh_until:
+                    return data
+
+                request_headers = dict(headers or {})
+                if etag:
+                    request_headers['If-None-Match'] = etag
+                if last_modified:
+                    request_headers['If-Modified-Since'] = last_modified
+
         for attempt in range(max_retries):
             try:
-                logger.debug(f"GET {url} (attempt {attempt + 1}/{max_retries})")
+                logger.debug("GET %s (attempt %d/%d)", url, attempt + 1, max_retries)
 
-                response = requests.get(
+                response = HTTPClient._get_session().get(
                     url,
-                    headers=headers,
+                    headers=request_headers,
                     params=params,
                     timeout=timeout
                 )
 
                 if response.status_code == HTTP_OK:
-                    logger.debug(f"GET {url} succeeded")
-                    return response.json()
+                    logger.debug("GET %s succeeded", url)
+                    data = response.json()
+                    if cache_key is not None:
+                        HTTPClient._store_response(cache_key, data, response, cache_ttl)
+                    return data
+
+                elif response.status_code == HTTP_NOT_MODIFIED and cached is not None:
+                    logger.debug("GET %s not modified, reusing cached response", url)
+                    data, etag, last_modified, _ = cached
+                    with HTTPClient._cache_lock:
+                        HTTPClient._response_cache[cache_key] = (
+                            data, etag, last_modified, time.monotonic() + cache_ttl
+                        )
+                    return data
 
                 elif response.status_code == HTTP_NOT_FOUND:
-                    logger.warning(f"Resource not found: {url}")
+                    logger.warning("Resource not found: %s", url)
                     return None
 
                 else:
-                    logger.warning(f"HTTP {response.status_code} from {url}")
-                    if attempt < max_retries - 1:
+                    logger.warning("HTTP %s from %s", response.status_code, url)
+                    if attempt < max_retries - 1 and _is_retryable(response.status_code):
+                        time.sleep(_retry_delay(attempt, response))
                         continue
                     return None
 
             except requests.Timeout:
-                logger.warning(f"Timeout on attempt {attempt + 1}/{max_retries} for {url}")
+                logger.warning("Timeout on attempt %d/%d for %s", attempt + 1, max_retries, url)
                 if attempt == max_retries - 1:
-                    logger.error(f"Max retries exceeded for {url}")
+                    logger.error("Max retries exceeded for %s", url)
                     return None
+                time.sleep(_retry_delay(attempt))
 
             except requests.RequestException as e:
-                logger.error(f"Request failed for {url}: {e}")
+                logger.error("Request failed for %s: %s", url, e)
                 if attempt == max_retries - 1:
                     return None
+                time.sleep(_retry_delay(attempt))
 
             except Exception as e:
-                logger.error(f"Unexpected error for {url}: {e}", exc_info=True)
+                logger.error("Unexpected error for %s: %s", url, e, exc_info=True)
                 return None
 
         return None
 
+    @staticmethod
+    def _store_response(cache_key: Tuple, data: Any, response: requests.Response, cache_ttl: int) -> None:
+        """Cache a parsed response with its validators"""
+        with HTTPClient._cache_lock:
+            HTTPClient._response_cache[cache_key] = (
+                data,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                time.monotonic() + cache_ttl
+            )
+
     @staticmethod
     def post(
         url: str,
@@ -122,9 +245,9 @@ class HTTPClient:
         """
         for attempt in range(max_retries):
             try:
-                logger.debug(f"POST {url} (attempt {attempt + 1}/{max_retries})")
+                logger.debug("POST %s (attempt %d/%d)", url, attempt + 1, max_retries)
 
-                response = requests.post(
+                response = HTTPClient._get_session().post(
                     url,
                     data=data,
                     json=json_data,
@@ -133,71 +256,173 @@ class HTTPClient:
                 )
 
                 if response.status_code == HTTP_OK:
-                    logger.debug(f"POST {url} succeeded")
+                    logger.debug("POST %s succeeded", url)
                     return response.json()
 
                 else:
-                    logger.warning(f"POST failed with HTTP {response.status_code} for {url}")
-                    if attempt < max_retries - 1:
+                    logger.warning("POST failed with HTTP %s for %s", response.status_code, url)
+                    if attempt < max_retries - 1 and _is_retryable(response.status_code):
+                        time.sleep(_retry_delay(attempt, response))
                         continue
                     return None
 
             except requests.Timeout:
-                logger.warning(f"POST timeout on attempt {attempt + 1}/{max_retries} for {url}")
+                logger.warning("POST timeout on attempt %d/%d for %s", attempt + 1, max_retries, url)
                 if attempt == max_retries - 1:
-                    logger.error(f"Max retries exceeded for {url}")
+                    logger.error("Max retries exceeded for %s", url)
                     return None
+                time.sleep(_retry_delay(attempt))
 
             except requests.RequestException as e:
-                logger.error(f"POST request failed for {url}: {e}")
+                logger.error("POST request failed for %s: %s", url, e)
                 if attempt == max_retries - 1:
                     return None
+                time.sleep(_retry_delay(attempt))
 
             except Exception as e:
-                logger.error(f"Unexpected error in POST {url}: {e}", exc_info=True)
+                logger.error("Unexpected error in POST %s: %s", url, e, exc_info=True)
                 return None
 
         return None
 
+    @staticmethod
+    def get_many(
+        urls: List[str],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = API_TIMEOUT_SHORT,
+        max_retries: int = MAX_RETRIES,
+        max_workers: int = 8
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Perform independent GET requests concurrently.
+
+        Requests overlap on the shared session's connection pool, so N calls
+        cost roughly the slowest one instead of the sum of all of them.
+
+        Args:
+            urls: Target URLs
+            headers: Optional HTTP headers sent with every request
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retry attempts per URL
+            max_workers: Maximum requests in flight at once
+
+        Returns:
+            Parsed JSON responses (None on failure), in the order of urls
+        """
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(
+                lambda url: HTTPClient.get(url, headers=headers, timeout=timeout, max_retries=max_retries),
+                urls
+            ))
+
     @staticmethod
     def download_file(
         url: str,
+        dest: Union[str, Path, BinaryIO],
         headers: Optional[Dict[str, str]] = None,
-        timeout: int = API_TIMEOUT_LONG
-    ) -> Optional[bytes]:
+        timeout: int = API_TIMEOUT_LONG,
+        chunk_size: int = 1024 * 1024
+    ) -> Optional[int]:
         """
-        Download file as bytes.
+        Stream a download to a file path or writable binary object.
+
+        Only one chunk is held in memory at a time, regardless of file size.
+        A partially written file at a path destination is removed on failure.
 
         Args:
             url: File URL
+            dest: Destination path, or a binary file-like object to write to
             headers: Optional HTTP headers
             timeout: Request timeout in seconds
+            chunk_size: Bytes read from the socket per write
 
         Returns:
-            File content as bytes or None on failure
+            Number of bytes written or None on failure
         """
+        dest_path = Path(dest) if isinstance(dest, (str, Path)) else None
+
         try:
-            logger.debug(f"Downloading file from {url}")
+            logger.debug("Downloading file from %s", url)
 
-            response = requests.get(
+            with HTTPClient._get_session().get(
                 url,
                 headers=headers,
                 timeout=timeout,
                 stream=True
-            )
+            ) as response:
+                if response.status_code != HTTP_OK:
+                    logger.error("Download failed with HTTP %s from %s", response.status_code, url)
+                    return None
 
-            if response.status_code == HTTP_OK:
-                content = response.content
-                logger.info(f"Downloaded {len(content)} bytes from {url}")
-                return content
+                total = 0
+                with (open(dest_path, 'wb') if dest_path else nullcontext(dest)) as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            total += len(chunk)
 
-            logger.error(f"Download failed with HTTP {response.status_code} from {url}")
-            return None
+            logger.info("Downloaded %d bytes from %s", total, url)
+            return total
 
         except requests.Timeout:
-            logger.error(f"Download timeout for {url}")
-            return None
+            logger.error("Download timeout for %s", url)
 
         except Exception as e:
-            logger.error(f"Download error for {url}: {e}", exc_info=True)
+            logger.error("Download error for %s: %s", url, e, exc_info=True)
+
+        if dest_path:
+            dest_path.unlink(missing_ok=True)
+        return None
+
+    @staticmethod
+    def download_bytes(
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = API_TIMEOUT_LONG
+    ) -> Optional[bytes]:
+        """
+        Download file as bytes.
+
+        Args:
+            url: File URL
+            headers: Optional HTTP headers
+            timeout: Request timeout in seconds
+
+        Returns:
+            File content as bytes or None on failure
+        """
+        buffer = io.BytesIO()
+        if HTTPClient.download_file(url, buffer, headers=headers, timeout=timeout) is None:
             return None
+        return buffer.getvalue()
+
+    @staticmethod
+    def download_files(
+        urls: List[str],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: int = API_TIMEOUT_LONG,
+        max_workers: int = 8
+    ) -> List[Optional[bytes]]:
+        """
+        Download several files concurrently over the shared connection pool.
+
+        Args:
+            urls: File URLs
+            headers: Optional HTTP headers sent with every request
+            timeout: Request timeout in seconds
+            max_workers: Maximum downloads in flight at once
+
+        Returns:
+            File contents (None on failure), in the order of urls
+        """
+        if not urls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(
+                lambda url: HTTPClient.download_bytes(url, headers=headers, timeout=timeout),
+                urls
+            ))
@@ -4,7 +4,14 @@ Ensures consistent response format across all endpoints.
 """
 
 from flask import jsonify
+from flask.json.provider import DefaultJSONProvider
 from typing import Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON serializer
+    orjson = None
+
 from ..constants import (
     HTTP_OK,
     HTTP_CREATED,
@@ -164,3 +171,47 @@ class ApiResponse:
             Tuple of (json_response, 500)
         """
         return ApiResponse.error(message, status_code=HTTP_INTERNAL_ERROR)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes responses with orjson.
+
+    Response bodies are written straight from orjson's bytes. Dates,
+    dataclasses and other non-native types are passed through to Flask's
+    default hook so their JSON form is unchanged. Falls back to the stdlib
+    provider when orjson is not installed.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._options()
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            option |= orjson.OPT_INDENT_2
+
+        body = orjson.dumps(obj, default=self.default, option=option)
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
+
+    def _options(self) -> int:
+        option = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+        )
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
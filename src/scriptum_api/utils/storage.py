@@ -2,8 +2,11 @@
 Cloud Storage utilities for large file uploads
 """
 import os
+import threading
+import uuid
 from datetime import timedelta, datetime
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
 import google.auth
 from google.auth.transport import requests as google_requests
 from google.auth import iam
@@ -11,9 +14,69 @@ from google.auth import compute_engine
 
 BUCKET_NAME = os.getenv('STORAGE_BUCKET', 'scriptum-uploads')
 
+# Large transfers: fewer, bigger range requests per blob
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+PARALLEL_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Signed URL lifetimes
+UPLOAD_URL_EXPIRATION = timedelta(hours=1)
+DOWNLOAD_URL_EXPIRATION = timedelta(hours=24)
+
+# Created once per process: building a client resolves ADC credentials and
+# the project and opens a new HTTP session
+_client = None
+_bucket = None
+_signing_credentials = None
+_signing_resolved = False
+_lock = threading.Lock()
+
 def get_storage_client():
-    """Get Cloud Storage client"""
-    return storage.Client()
+    """Get the shared Cloud Storage client"""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = storage.Client()
+    return _client
+
+def _get_bucket():
+    """Get the shared bucket handle"""
+    global _bucket
+    if _bucket is None:
+        bucket = get_storage_client().bucket(BUCKET_NAME)
+        with _lock:
+            if _bucket is None:
+                _bucket = bucket
+    return _bucket
+
+def _get_signing_credentials():
+    """
+    IAM signer for Cloud Run, None when the default credentials can sign
+
+    The signer refreshes its access token itself when it expires, so it is
+    built once instead of on every signed URL.
+    """
+    global _signing_credentials, _signing_resolved
+    if not _signing_resolved:
+        with _lock:
+            if not _signing_resolved:
+                credentials, project = google.auth.default()
+
+                # For Cloud Run, we need to use IAM signBlob API
+                if isinstance(credentials, compute_engine.Credentials):
+                    # Get service account email
+                    auth_request = google_requests.Request()
+                    credentials.refresh(auth_request)
+                    service_account_email = credentials.service_account_email
+
+                    # Create signing credentials using IAM
+                    _signing_credentials = iam.Signer(
+                        auth_request,
+                        credentials,
+                        service_account_email
+                    )
+                _signing_resolved = True
+    return _signing_credentials
 
 def generate_upload_signed_url(filename: str, content_type: str = 'video/*') -> dict:
     """
@@ -26,47 +89,18 @@ def generate_upload_signed_url(filename: str, content_type: str = 'video/*') ->
     Returns:
         dict with signed_url and blob_name
     """
-    import uuid
-
-    client = get_storage_client()
-    bucket = client.bucket(BUCKET_NAME)
-
     # Generate unique blob name
     blob_name = f"uploads/{datetime.now().strftime('%Y%m%d')}/{uuid.uuid4().hex}_{filename}"
-    blob = bucket.blob(blob_name)
+    blob = _get_bucket().blob(blob_name)
 
-    # Get credentials and signing method
-    credentials, project = google.auth.default()
-
-    # For Cloud Run, we need to use IAM signBlob API
-    if isinstance(credentials, compute_engine.Credentials):
-        # Get service account email
-        auth_request = google_requests.Request()
-        credentials.refresh(auth_request)
-        service_account_email = credentials.service_account_email
-
-        # Create signing credentials using IAM
-        signing_credentials = iam.Signer(
-            auth_request,
-            credentials,
-            service_account_email
-        )
-
-        url = blob.generate_signed_url(
-            version='v4',
-            expiration=timedelta(hours=1),
-            method='PUT',
-            content_type=content_type,
-            credentials=signing_credentials,
-        )
-    else:
-        # Use default signing for local development
-        url = blob.generate_signed_url(
-            version='v4',
-            expiration=timedelta(hours=1),
-            method='PUT',
-            content_type=content_type,
-        )
+    # None lets the client sign with its own credentials (local development)
+    url = blob.generate_signed_url(
+        version='v4',
+        expiration=UPLOAD_URL_EXPIRATION,
+        method='PUT',
+        content_type=content_type,
+        credentials=_get_signing_credentials(),
+    )
 
     return {
         'signed_url': url,
@@ -76,28 +110,73 @@ def generate_upload_signed_url(filename: str, content_type: str = 'video/*') ->
 
 def get_blob_download_url(blob_name: str) -> str:
     """Get temporary download URL for a blob"""
-    client = get_storage_client()
-    bucket = client.bucket(BUCKET_NAME)
-    blob = bucket.blob(blob_name)
+    blob = _get_bucket().blob(blob_name)
 
     return blob.generate_signed_url(
         version='v4',
-        expiration=timedelta(hours=24),
+        expiration=DOWNLOAD_URL_EXPIRATION,
         method='GET'
     )
 
 def download_blob_to_file(blob_name: str, destination_path: str):
     """Download blob to local file"""
-    client = get_storage_client()
-    bucket = client.bucket(BUCKET_NAME)
+    blob = _get_bucket().blob(blob_name, chunk_size=DOWNLOAD_CHUNK_SIZE)
+
+    # Videos are stored as-is; raw_download skips gzip transcoding handling
+    blob.download_to_filename(destination_path, raw_download=True)
+    return destination_path
+
+def download_blob_to_file_parallel(
+    blob_name: str,
+    destination_path: str,
+    workers: int = 8,
+    bucket_name: str = None
+):
+    """
+    Download blob to local file with concurrent range requests
+
+    Splits the blob into PARALLEL_CHUNK_SIZE slices fetched by a thread pool
+    and written in place, for multi-GB videos where one stream is the limit.
+    bucket_name selects another bucket (e.g. from a gs:// path); the
+    default is the uploads bucket.
+    """
+    bucket = get_storage_client().bucket(bucket_name) if bucket_name else _get_bucket()
     blob = bucket.blob(blob_name)
 
-    blob.download_to_filename(destination_path)
+    transfer_manager.download_chunks_concurrently(
+        blob,
+        destination_path,
+        chunk_size=PARALLEL_CHUNK_SIZE,
+        worker_type=transfer_manager.THREAD,
+        max_workers=workers,
+    )
     return destination_path
 
 def delete_blob(blob_name: str):
     """Delete blob from storage"""
-    client = get_storage_client()
-    bucket = client.bucket(BUCKET_NAME)
-    blob = bucket.blob(blob_name)
+    blob = _get_bucket().blob(blob_name)
     blob.delete()
+
+# Cloud Storage accepts at most 100 calls per batch request
+DELETE_BATCH_SIZE = 100
+
+def delete_blobs(blobs: list, bucket=None) -> int:
+    """
+    Delete many blobs with batched requests
+
+    Each group of up to DELETE_BATCH_SIZE deletes goes out as one multipart
+    HTTP request instead of one DELETE per blob.
+
+    Args:
+        blobs: Blob names or Blob objects
+        bucket: Bucket the names refer to (default: BUCKET_NAME)
+
+    Returns:
+        Number of blobs deleted
+    """
+    bucket = bucket or _get_bucket()
+    for i in range(0, len(blobs), DELETE_BATCH_SIZE):
+        with bucket.client.batch():
+            for blob in blobs[i:i + DELETE_BATCH_SIZE]:
+                (bucket.blob(blob) if isinstance(blob, str) else blob).delete()
+    return len(blobs)
@@ -7,6 +7,20 @@ import re
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
+# SRT blocks are separated by blank lines
+_BLOCK_SEP_RE = re.compile(r'\n\n+')
+
+# Zeroed problem counters; copied for each validation
+_EMPTY_STATS = {
+    'long_durations': 0,
+    'long_lines': 0,
+    'long_pauses': 0,
+    'high_cps': 0,
+    'empty': 0,
+    'short_durations': 0,
+    'too_many_lines': 0
+}
+
 
 def parse_timestamp(timestamp: str) -> timedelta:
     """Parse SRT timestamp to timedelta"""
@@ -20,6 +34,13 @@ def parse_timestamp(timestamp: str) -> timedelta:
     )
 
 
+def _timestamp_ms(timestamp: str) -> int:
+    """Parse SRT timestamp to integer milliseconds (same rules as parse_timestamp)"""
+    h, m, s_ms = timestamp.split(':')
+    s, ms = s_ms.split(',')
+    return ((int(h) * 60 + int(m)) * 60 + int(s)) * 1000 + int(ms)
+
+
 def format_timestamp(td: timedelta) -> str:
     """Format timedelta back to SRT timestamp"""
     total_seconds = int(td.total_seconds())
@@ -67,10 +88,10 @@ def validate_subtitles(srt_content: str) -> Dict[str, Any]:
         }
     """
 
-    # PT-PT Professional Standards
-    MIN_DURATION = 1.0      # seconds
-    MAX_DURATION = 6.0      # seconds
-    WARN_DURATION = 5.0     # warn if approaching max
+    # PT-PT Professional Standards (times in integer milliseconds)
+    MIN_DURATION_MS = 1000
+    MAX_DURATION_MS = 6000
+    WARN_DURATION_MS = 5000  # warn if approaching max
 
     IDEAL_CHARS = 37        # ideal chars/line
     MAX_CHARS = 42          # max acceptable (DVD standard)
@@ -81,23 +102,24 @@ def validate_subtitles(srt_content: str) -> Dict[str, Any]:
 
     MAX_LINES = 2           # max lines per subtitle
 
-    MIN_GAP = 0.08          # min gap between subtitles (2 frames @ 24fps)
+    MIN_GAP_MS = 80         # min gap between subtitles (2 frames @ 24fps)
+
+    srt_content = srt_content.strip() if srt_content else ''
+    if not srt_content:
+        return {
+            'total_entries': 0,
+            'problems': [],
+            'stats': _EMPTY_STATS.copy(),
+            'has_problems': False
+        }
 
     problems = []
-    stats = {
-        'long_durations': 0,
-        'long_lines': 0,
-        'long_pauses': 0,
-        'high_cps': 0,
-        'empty': 0,
-        'short_durations': 0,
-        'too_many_lines': 0
-    }
+    stats = _EMPTY_STATS.copy()
 
     # Parse SRT
-    entries = re.split(r'\n\n+', srt_content.strip())
+    entries = _BLOCK_SEP_RE.split(srt_content)
 
-    previous_end_time = None
+    previous_end_ms = None
 
     for i, entry in enumerate(entries):
         lines = entry.strip().split('\n')
@@ -111,49 +133,49 @@ def validate_subtitles(srt_content: str) -> Dict[str, Any]:
             continue
 
         timecode = lines[1]
-        text = '\n'.join(lines[2:])
+        text_lines = lines[2:]
+        text = '\n'.join(text_lines)
 
         # Parse times
         try:
             start_str, end_str = timecode.split(' --> ')
-            start_time = parse_timestamp(start_str.strip())
-            end_time = parse_timestamp(end_str.strip())
+            start_ms = _timestamp_ms(start_str.strip())
+            end_ms = _timestamp_ms(end_str.strip())
         except (ValueError, AttributeError):
             continue
 
-        duration = (end_time - start_time).total_seconds()
+        duration_ms = end_ms - start_ms
 
         # Check 1: Duration (PT-PT: 1-6 seconds)
-        if duration < MIN_DURATION:
+        if duration_ms < MIN_DURATION_MS:
             stats['short_durations'] += 1
             problems.append({
                 'index': index,
                 'type': 'short_duration',
                 'severity': 'warning',
-                'message': f'Duração muito curta: {duration:.1f}s (mín: {MIN_DURATION}s)',
+                'message': f'Duração muito curta: {duration_ms / 1000:.1f}s (mín: {MIN_DURATION_MS / 1000}s)',
                 'timecode': timecode,
                 'text': text,
                 'suggestion': 'Aumentar duração para mínimo 1 segundo'
             })
 
-        if duration > MAX_DURATION:
+        if duration_ms > MAX_DURATION_MS:
             stats['long_durations'] += 1
-            severity = 'error' if duration > MAX_DURATION * 1.5 else 'warning'
+            severity = 'error' if duration_ms * 2 > MAX_DURATION_MS * 3 else 'warning'
 
             problems.append({
                 'index': index,
                 'type': 'long_duration',
                 'severity': severity,
-                'message': f'Duração muito longa: {duration:.1f}s (máx: {MAX_DURATION}s)',
+                'message': f'Duração muito longa: {duration_ms / 1000:.1f}s (máx: {MAX_DURATION_MS / 1000}s)',
                 'timecode': timecode,
                 'text': text,
                 'suggestion': 'Dividir em 2+ legendas ou reduzir texto'
             })
 
         # Check 2: Line length (PT-PT: ideal 37, max 42, warn at 46)
-        text_lines = text.split('\n')
         num_lines = len(text_lines)
-        max_line_length = max(len(line) for line in text_lines) if text_lines else 0
+        max_line_length = max(map(len, text_lines))
 
         if num_lines > MAX_LINES:
             stats['too_many_lines'] += 1
@@ -182,8 +204,8 @@ def validate_subtitles(srt_content: str) -> Dict[str, Any]:
             })
 
         # Check 3: CPS - Characters Per Second (PT-PT: ideal 12-15, max 17)
-        total_chars = len(text.replace('\n', ''))
-        cps = total_chars / duration if duration > 0 else 0
+        total_chars = len(text) - (num_lines - 1)  # without the line breaks
+        cps = total_chars * 1000 / duration_ms if duration_ms > 0 else 0
 
         if cps > MAX_CPS:
             stats['high_cps'] += 1
@@ -214,49 +236,49 @@ def validate_subtitles(srt_content: str) -> Dict[str, Any]:
             })
 
         # Check 5: Gaps between subtitles
-        if previous_end_time:
-            gap = (start_time - previous_end_time).total_seconds()
+        if previous_end_ms:
+            gap_ms = start_ms - previous_end_ms
 
             # Too small gap (< 2 frames @ 24fps)
-            if gap < MIN_GAP and gap >= 0:
+            if 0 <= gap_ms < MIN_GAP_MS:
                 problems.append({
                     'index': index,
                     'type': 'gap_too_small',
                     'severity': 'warning',
-                    'message': f'Gap muito pequeno: {gap*1000:.0f}ms (mín: {MIN_GAP*1000:.0f}ms)',
+                    'message': f'Gap muito pequeno: {gap_ms}ms (mín: {MIN_GAP_MS}ms)',
                     'timecode': timecode,
                     'text': text,
                     'suggestion': 'Aumentar gap para mínimo 2 frames (~80ms)'
                 })
 
             # Overlapping subtitles
-            elif gap < 0:
+            elif gap_ms < 0:
                 problems.append({
                     'index': index,
                     'type': 'overlap',
                     'severity': 'error',
-                    'message': f'Sobreposição de {abs(gap):.2f}s com legenda anterior',
+                    'message': f'Sobreposição de {-gap_ms / 1000:.2f}s com legenda anterior',
                     'timecode': timecode,
                     'text': text,
                     'suggestion': 'Ajustar timings para não sobrepor'
                 })
 
             # Very long pause (might indicate missing subtitles)
-            elif gap > 20:
+            elif gap_ms > 20000:
                 stats['long_pauses'] += 1
-                severity = 'error' if gap > 60 else 'info'
+                severity = 'error' if gap_ms > 60000 else 'info'
 
                 problems.append({
                     'index': index,
                     'type': 'long_pause',
                     'severity': severity,
-                    'message': f'Pausa muito longa: {gap:.1f}s antes desta legenda',
+                    'message': f'Pausa muito longa: {gap_ms / 1000:.1f}s antes desta legenda',
                     'timecode': timecode,
                     'text': text,
                     'suggestion': 'Verificar se há diálogo em falta ou se a pausa é intencional'
                 })
 
-        previous_end_time = end_time
+        previous_end_ms = end_ms
 
     return {
         'total_entries': len(entries),
@@ -6,48 +6,114 @@ Detecta problemas de framerate E sincronização, corrige automaticamente
 Uso: python3 smart_sync.py <video> <legenda.srt>
 """
 
+import bisect
+import json
+import math
+import os
 import subprocess
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import sys
 import pysrt
 import statistics
 import re
 
+try:
+    import av
+except ImportError:  # pragma: no cover - descodificação in-process opcional (PyAV)
+    av = None
+
+from .whisper_pool import detect_language as whisper_detect_language, transcribe as whisper_transcribe
+
+# Modelos Whisper quantizados a 4-bit (WHISPER_MODEL=...-8bit se a precisão cair)
+WHISPER_MODEL = os.getenv('WHISPER_MODEL', "mlx-community/whisper-tiny-mlx-4bit")
+
+# Modelo Whisper para deteção de idioma (só o encoder é usado)
+LANGUAGE_DETECTION_MODEL = os.getenv('WHISPER_LANGUAGE_MODEL', WHISPER_MODEL)
+
+# Etiquetas de idioma em nomes de legendas (ISO 639-1 e 639-2) → código Whisper
+SUBTITLE_LANGUAGE_CODES = {
+    'en': 'en', 'eng': 'en',
+    'pt': 'pt', 'por': 'pt', 'pob': 'pt',
+    'es': 'es', 'spa': 'es',
+    'fr': 'fr', 'fre': 'fr', 'fra': 'fr',
+    'de': 'de', 'ger': 'de', 'deu': 'de',
+    'it': 'it', 'ita': 'it',
+    'nl': 'nl', 'dut': 'nl', 'nld': 'nl',
+    'ru': 'ru', 'rus': 'ru',
+    'ja': 'ja', 'jpn': 'ja',
+    'ko': 'ko', 'kor': 'ko',
+    'zh': 'zh', 'chi': 'zh', 'zho': 'zh',
+}
+_FILENAME_LANGUAGE_RE = re.compile(r'\.([A-Za-z]{2,3}(?:-[A-Za-z]{2})?)$')
+
+
+def get_video_probe(video_path):
+    """
+    Obtém streams e formato do vídeo numa única chamada ao ffprobe.
 
-def get_video_framerate(video_path):
-    """Obtém framerate do vídeo"""
+    O resultado fica em cache por (caminho, mtime, tamanho), por isso
+    framerate, duração e codec de áudio partilham o mesmo ffprobe.
+    """
+    stat = os.stat(video_path)
+    return _probe(str(video_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _probe(video_path, mtime_ns, size):
+    """ffprobe em JSON (mtime/tamanho só entram na chave da cache)"""
     result = subprocess.run(
         [
             "ffprobe",
             "-v", "quiet",
-            "-select_streams", "v:0",
-            "-show_entries", "stream=r_frame_rate",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
+            "-print_format", "json",
+            "-show_streams",
+            "-show_format",
+            video_path
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
         check=True,
         text=True
     )
-    frac = result.stdout.strip()
+    return json.loads(result.stdout)
+
+
+def _first_stream(probe, codec_type):
+    """Primeiro stream do tipo indicado (equivalente a -select_streams v:0 / a:0)"""
+    for stream in probe.get("streams", ()):
+        if stream.get("codec_type") == codec_type:
+            return stream
+    return None
+
+
+def get_video_framerate(video_path):
+    """Obtém framerate do vídeo"""
+    frac = _first_stream(get_video_probe(video_path), "video")["r_frame_rate"]
     num, den = map(int, frac.split('/'))
     return round(num / den, 3)
 
 
-def detect_srt_framerate(srt_path):
-    """Infere framerate das legendas SRT"""
-    subs = pysrt.open(srt_path)
+def load_subtitles(srt):
+    """
+    Lê as legendas SRT uma vez para as partilhar entre os passos da sincronização.
+
+    Args:
+        srt: Caminho do ficheiro SRT ou SubRipFile já lido (devolvido tal como está)
+    """
+    return srt if isinstance(srt, pysrt.SubRipFile) else pysrt.open(srt)
+
+
+def detect_srt_framerate(srt):
+    """Infere framerate das legendas SRT (caminho ou SubRipFile)"""
+    subs = load_subtitles(srt)
 
     if len(subs) < 100:
         return None
 
     # Analisar padrão de milissegundos
-    ms_values = []
-    for sub in subs[:200]:
-        ms = sub.start.milliseconds
-        ms_values.append(ms)
+    ms_values = [sub.start.milliseconds for sub in subs[:200]]
 
     # Framerates comuns e seus padrões
     common_fps = [23.976, 24, 25, 29.97, 30, 50, 59.94, 60]
@@ -58,7 +124,7 @@ def detect_srt_framerate(srt_path):
     best_score = 0
 
     for fps, frame_ms in frame_durations.items():
-        score = sum(1 for ms in ms_values if abs(ms % frame_ms) < 5)
+        score = sum(1 for ms in ms_values if ms % frame_ms < 5)
         if score > best_score:
             best_score = score
             best_fps = fps
@@ -66,59 +132,35 @@ def detect_srt_framerate(srt_path):
     return best_fps
 
 
-def convert_framerate(srt_path, from_fps, to_fps, output_path):
-    """Converte framerate das legendas"""
-    subs = pysrt.open(srt_path)
+def convert_framerate(srt, from_fps, to_fps, output_path=None):
+    """
+    Converte framerate das legendas
+
+    Um SubRipFile é alterado no próprio objeto; só grava se output_path for dado.
+    """
+    subs = load_subtitles(srt)
     ratio = to_fps / from_fps
 
     for sub in subs:
         # Converter timestamps
-        start_ms = sub.start.ordinal
-        end_ms = sub.end.ordinal
+        sub.start.ordinal = int(sub.start.ordinal * ratio)
+        sub.end.ordinal = int(sub.end.ordinal * ratio)
 
-        sub.start.ordinal = int(start_ms * ratio)
-        sub.end.ordinal = int(end_ms * ratio)
-
-    subs.save(output_path)
+    if output_path is not None:
+        subs.save(output_path)
+    return subs
 
 
 def get_video_duration(video_path):
     """Obtém duração do vídeo"""
-    result = subprocess.run(
-        [
-            "ffprobe",
-            "-v", "quiet",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path)
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.DEVNULL,
-        check=True,
-        text=True
-    )
-    return float(result.stdout.strip())
+    return float(get_video_probe(video_path)["format"]["duration"])
 
 
 def get_audio_codec(video_path):
     """Deteta o codec de áudio do vídeo"""
     try:
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "quiet",
-                "-select_streams", "a:0",
-                "-show_entries", "stream=codec_name",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                str(video_path)
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            text=True,
-            check=True
-        )
-        codec = result.stdout.strip().lower()
-        return codec
+        stream = _first_stream(get_video_probe(video_path), "audio")
+        return stream["codec_name"].lower() if stream else None
     except:
         return None
 
@@ -160,7 +202,7 @@ def ensure_compatible_audio_cached(video_path, gcs_video_path=None):
 
     # Modo GCS: cache permanente no GCS
     if gcs_video_path:
-        from google.cloud import storage as gcs_storage
+        from .storage import get_storage_client
 
         # Parse GCS path: gs://bucket/path/video.mkv -> bucket, path/video.aac
         gcs_path = gcs_video_path[5:]  # strip gs://
@@ -174,8 +216,8 @@ def ensure_compatible_audio_cached(video_path, gcs_video_path=None):
         # Local AAC path (same name as video but .aac)
         aac_local_path = video_path.with_suffix('.aac')
 
-        gcs_client = gcs_storage.Client()
-        bucket_ref = gcs_client.bucket(bucket_name)
+        # Cliente partilhado pelo processo (credenciais ADC resolvidas uma vez)
+        bucket_ref = get_storage_client().bucket(bucket_name)
         aac_blob = bucket_ref.blob(aac_object_name)
 
         # Check if AAC exists in GCS
@@ -198,7 +240,7 @@ def ensure_compatible_audio_cached(video_path, gcs_video_path=None):
                 [
                     "ffmpeg", "-y",
                     "-i", str(video_path),
-                    "-vn",  # No video
+                    "-vn", "-sn", "-dn",  # Só áudio
                     "-c:a", "aac",
                     "-b:a", "192k",  # Good quality
                     str(aac_local_path)
@@ -244,7 +286,7 @@ def ensure_compatible_audio_cached(video_path, gcs_video_path=None):
                 [
                     "ffmpeg", "-y",
                     "-i", str(video_path),
-                    "-vn",  # Sem vídeo
+                    "-vn", "-sn", "-dn",  # Só áudio
                     "-c:a", "aac",
                     "-b:a", "192k",  # Qualidade boa
                     str(aac_cache_path)
@@ -266,63 +308,257 @@ def ensure_compatible_audio_cached(video_path, gcs_video_path=None):
             return video_path
 
 
-def extract_audio(video_path, audio_path, start_time=0, duration=60, gcs_video_path=None):
+def load_segments(audio_source, segments):
     """
-    Extrai segmento de áudio do vídeo.
-    Se o vídeo tem áudio AC3/DTS, usa cache AAC automaticamente.
-    Se vídeo veio do GCS, usa cache AAC do GCS.
+    Decodifica vários segmentos de áudio mono 16kHz para memória.
+
+    Com PyAV o ficheiro é aberto uma só vez e cada segmento é um seek +
+    descodificação in-process, sem lançar ffmpeg. Sem PyAV, recorre a uma
+    única chamada ao ffmpeg com cada saída PCM num pipe próprio (sem WAV
+    em disco).
 
     Args:
-        video_path: Caminho local do vídeo
-        audio_path: Caminho de saída para o áudio extraído
+        audio_source: Caminho do vídeo ou do AAC em cache
+        segments: Lista de (start_time, duration)
+
+    Returns:
+        Lista de numpy.ndarray float32 normalizados em [-1, 1], pela ordem dada
+    """
+    if av is not None:
+        return _decode_segments_av(audio_source, segments)
+    return _pipe_segments(audio_source, segments)
+
+
+def _read_fd(fd):
+    """Lê um pipe até EOF (fecha o descritor)"""
+    with os.fdopen(fd, "rb") as pipe:
+        return pipe.read()
+
+
+def _pipe_segments(audio_source, segments):
+    """
+    Descodifica segmentos com um só ffmpeg, cada saída s16le no seu pipe.
+
+    Cada segmento é um input próprio com seek rápido (-ss antes de -i) e a
+    saída N vai para pipe:<fd>. Os pipes são lidos em paralelo para
+    o ffmpeg não bloquear num pipe cheio enquanto se lê outro.
+    """
+    import numpy as np
+
+    if not segments:
+        return []
+
+    cmd = ["ffmpeg"]
+    for start_time, duration in segments:
+        cmd += ["-ss", str(start_time), "-t", str(duration), "-i", str(audio_source)]
+
+    read_fds, write_fds = [], []
+    try:
+        for idx in range(len(segments)):
+            read_fd, write_fd = os.pipe()
+            read_fds.append(read_fd)
+            write_fds.append(write_fd)
+            cmd += [
+                "-map", f"{idx}:a:0", "-vn", "-sn", "-dn",
+                "-f", "s16le", "-ac", "1", "-ar", "16000", f"pipe:{write_fd}"
+            ]
+
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            pass_fds=write_fds
+        )
+    except BaseException:
+        for fd in read_fds + write_fds:
+            os.close(fd)
+        raise
+
+    # Só o ffmpeg fica com as pontas de escrita: EOF quando terminar
+    for fd in write_fds:
+        os.close(fd)
+
+    with ThreadPoolExecutor(max_workers=len(read_fds)) as executor:
+        buffers = list(executor.map(_read_fd, read_fds))
+
+    if process.wait() != 0:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+    return [np.frombuffer(buffer, np.int16).astype(np.float32) / 32768.0 for buffer in buffers]
+
+
+def _decode_segments_av(audio_source, segments):
+    """Descodifica segmentos com PyAV num único container aberto"""
+    import numpy as np
+
+    sample_rate = 16000
+    results = []
+
+    with av.open(str(audio_source)) as container:
+        stream = container.streams.audio[0]
+
+        for start_time, duration in segments:
+            end_time = start_time + duration
+            resampler = av.AudioResampler(format='s16', layout='mono', rate=sample_rate)
+            chunks = []
+            first_time = None
+
+            # Seek para o keyframe anterior; o excesso é cortado abaixo
+            container.seek(int(start_time * av.time_base))
+            for frame in container.decode(stream):
+                if frame.time is None:
+                    continue
+                if frame.time >= end_time:
+                    break
+                if frame.time + frame.samples / frame.sample_rate <= start_time:
+                    continue
+                if first_time is None:
+                    first_time = frame.time
+                chunks.extend(out.to_ndarray() for out in resampler.resample(frame))
+            chunks.extend(out.to_ndarray() for out in resampler.resample(None))
+
+            if not chunks:
+                results.append(np.zeros(0, np.float32))
+                continue
+
+            # Corte exato ao início/duração pedidos (como -ss/-t no ffmpeg)
+            pcm = np.concatenate(chunks, axis=1).reshape(-1)
+            skip = max(0, round((start_time - first_time) * sample_rate))
+            pcm = pcm[skip:skip + int(duration * sample_rate)]
+            results.append(pcm.astype(np.float32) / 32768.0)
+
+    return results
+
+
+def load_segment(audio_source, start_time=0, duration=30):
+    """
+    Decodifica um segmento de áudio diretamente para memória (sem WAV em disco).
+
+    Usa PyAV se disponível; caso contrário o ffmpeg escreve PCM s16le mono
+    16kHz no stdout, convertido para o array float32 que o MLX Whisper
+    aceita diretamente.
+
+    Args:
+        audio_source: Caminho do vídeo ou do AAC em cache
         start_time: Tempo inicial em segundos
         duration: Duração em segundos
-        gcs_video_path: GCS path original (gs://...) ou None se for upload local
+
+    Returns:
+        numpy.ndarray float32 normalizado em [-1, 1]
     """
-    # Garantir que temos áudio compatível (usa cache se disponível)
-    audio_source = ensure_compatible_audio_cached(video_path, gcs_video_path)
+    if av is not None:
+        return _decode_segments_av(audio_source, [(start_time, duration)])[0]
+
+    import numpy as np
 
-    subprocess.run(
+    result = subprocess.run(
         [
             "ffmpeg",
-            "-y",
             "-ss", str(start_time),
             "-t", str(duration),
-            "-i", str(audio_source),  # Usa AAC cache se disponível
+            "-i", str(audio_source),
+            "-vn", "-sn", "-dn",  # Só áudio: não abrir descodificadores de vídeo/legendas
+            "-f", "s16le",
             "-ac", "1",
             "-ar", "16000",
-            str(audio_path)
+            "pipe:1"
         ],
-        stdout=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
         stderr=subprocess.DEVNULL,
         check=True
     )
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
+def _whisper_input(audio):
+    """Caminhos passam como str; arrays já descodificados passam intactos"""
+    return str(audio) if isinstance(audio, (str, Path)) else audio
+
+
+def normalize_language(code):
+    """
+    Converte um código de idioma (ISO 639-1/2) para o código Whisper.
+
+    Args:
+        code: Código de idioma (en, eng, pt, por, pt-BR, ...)
+
+    Returns:
+        Código Whisper (en, pt, etc) ou None se não for reconhecido
+    """
+    if not code:
+        return None
+    return SUBTITLE_LANGUAGE_CODES.get(code.lower().split('-')[0])
 
 
-def transcribe(audio_path, language="en"):
-    """Transcreve áudio com Whisper MLX"""
-    import mlx_whisper
-    result = mlx_whisper.transcribe(
-        str(audio_path),
-        path_or_hf_repo="mlx-community/whisper-tiny",
+def language_from_filename(filename):
+    """
+    Obtém o idioma da etiqueta no nome da legenda (filme.en.srt, filme.por.srt).
+
+    Etiquetas de 2 letras escritas como palavra de título ("Movie.It.srt")
+    fazem parte do nome, não indicam idioma; "movie.it.srt" e "Movie.IT.srt" sim.
+
+    Returns:
+        Código Whisper ou None se o nome não tiver etiqueta reconhecida
+    """
+    match = _FILENAME_LANGUAGE_RE.search(Path(filename).stem)
+    if not match:
+        return None
+    tag = match.group(1).split('-')[0]
+    if len(tag) == 2 and not (tag.islower() or tag.isupper()):
+        return None
+    return normalize_language(tag)
+
+
+def transcribe(audio, language="en"):
+    """Transcreve áudio (caminho ou array) com Whisper MLX (modelo carregado uma vez por processo)"""
+    result = whisper_transcribe(
+        _whisper_input(audio),
+        WHISPER_MODEL,
         language=language  # Forçar inglês para máxima precisão!
     )
     return result["segments"]
 
 
-def compute_offset_for_segment(srt_path, segments, start_time_offset):
-    """Calcula offset para um segmento"""
-    subs = pysrt.open(srt_path)
+def detect_language(audio):
+    """
+    Deteta o idioma do áudio só com o encoder do Whisper.
+
+    Usa a cabeça de deteção de idioma sobre o espectrograma dos primeiros 30s,
+    sem passar pelo decoder (não gera texto).
+
+    Args:
+        audio: Caminho do ficheiro de áudio ou array float32 a 16kHz
+
+    Returns:
+        Código do idioma (en, pt, etc)
+    """
+    return whisper_detect_language(_whisper_input(audio), LANGUAGE_DETECTION_MODEL)
+
+
+def subtitle_start_times(srt):
+    """Inícios das legendas em segundos, ordenados (para pesquisa binária)"""
+    return sorted(sub.start.ordinal / 1000 for sub in load_subtitles(srt))
+
+
+def compute_offset_for_segment(sub_times, segments, start_time_offset):
+    """
+    Calcula offset para um segmento
+
+    Args:
+        sub_times: Inícios das legendas em segundos, ordenados (subtitle_start_times)
+        segments: Segmentos transcritos pelo Whisper
+        start_time_offset: Início da amostra no vídeo, em segundos
+    """
     offsets = []
 
     for seg in segments[:15]:
         absolute_time = start_time_offset + seg["start"]
 
-        for sub in subs:
-            sub_time = sub.start.ordinal / 1000
-            if abs(sub_time - absolute_time) < 5:
-                offsets.append(absolute_time - sub_time)
-                break
+        # Primeira legenda a menos de 5s: pesquisa binária em vez de percorrer todas
+        idx = bisect.bisect_right(sub_times, absolute_time - 5)
+        if idx < len(sub_times) and sub_times[idx] - absolute_time < 5:
+            offsets.append(absolute_time - sub_times[idx])
 
     if not offsets:
         return None
@@ -330,45 +566,81 @@ def compute_offset_for_segment(srt_path, segments, start_time_offset):
     return statistics.median(offsets)
 
 
-def analyze_sync(srt_path, video_path, video_duration, num_samples=5, language="en", gcs_video_path=None):
+def sync_sample_points(video_duration, num_samples=5):
+    """Pontos de amostragem (segundos) igualmente espaçados ao longo do vídeo"""
+    step = video_duration / (num_samples + 1)
+    return [step * i for i in range(1, num_samples + 1)]
+
+
+def load_sync_samples(video_path, video_duration, num_samples=5, gcs_video_path=None):
+    """
+    Descodifica as amostras de áudio usadas por analyze_sync.
+
+    Carregadas à parte para que a deteção de idioma possa usar a primeira
+    amostra em vez de extrair um clip próprio.
+
+    Args:
+        video_path: Caminho local do vídeo
+        video_duration: Duração do vídeo em segundos
+        num_samples: Número de pontos de amostragem
+        gcs_video_path: GCS path original (gs://...) ou None
+
+    Returns:
+        Lista de arrays float32 a 16kHz, pela ordem de sync_sample_points
+    """
+    # Resolver a fonte de áudio uma só vez (conversão AAC não pode correr em paralelo)
+    audio_source = ensure_compatible_audio_cached(video_path, gcs_video_path)
+
+    # Todas as amostras descodificadas de uma vez (PyAV ou um único ffmpeg)
+    return load_segments(
+        audio_source,
+        [(int(start_time), 45) for start_time in sync_sample_points(video_duration, num_samples)]
+    )
+
+
+def analyze_sync(srt, video_path, video_duration, num_samples=5, language="en", gcs_video_path=None, audios=None):
     """Analisa sincronização
 
     Args:
-        srt_path: Caminho do ficheiro SRT
+        srt: Caminho do ficheiro SRT ou SubRipFile já lido
         video_path: Caminho local do vídeo
         video_duration: Duração do vídeo em segundos
         num_samples: Número de pontos de amostragem
         language: Idioma para transcrição
         gcs_video_path: GCS path original (gs://...) ou None
+        audios: Amostras já descodificadas por load_sync_samples (opcional)
     """
-    sample_points = []
-    step = video_duration / (num_samples + 1)
-    for i in range(1, num_samples + 1):
-        sample_points.append(step * i)
+    sample_points = sync_sample_points(video_duration, num_samples)
 
-    offsets = []
+    if audios is None:
+        audios = load_sync_samples(video_path, video_duration, num_samples, gcs_video_path)
+
+    # SRT lido uma vez para todas as amostras
+    sub_times = subtitle_start_times(srt)
 
-    with tempfile.TemporaryDirectory() as tmp:
-        for idx, start_time in enumerate(sample_points, 1):
-            audio = Path(tmp) / f"sample_{idx}.wav"
-            extract_audio(video_path, audio, start_time=int(start_time), duration=45, gcs_video_path=gcs_video_path)
-            segments = transcribe(audio, language=language)
-            offset = compute_offset_for_segment(srt_path, segments, start_time)
-            if offset is not None:
-                offsets.append(offset)
+    def analyze_point(audio, start_time):
+        # Inferência MLX é serializada; o cálculo de offset sobrepõe-se à seguinte
+        segments = transcribe(audio, language=language)
+        return compute_offset_for_segment(sub_times, segments, start_time)
+
+    workers = min(num_samples, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(analyze_point, audios, sample_points)
+        offsets = [offset for offset in results if offset is not None]
 
     if len(offsets) < 3:
         return None, None, None
 
-    avg_offset = statistics.mean(offsets)
-    std_dev = statistics.stdev(offsets) if len(offsets) > 1 else 0
+    # Float mean/desvio amostral (statistics.mean/stdev usam frações exatas)
+    avg_offset = statistics.fmean(offsets)
+    std_dev = math.sqrt(sum((o - avg_offset) ** 2 for o in offsets) / (len(offsets) - 1))
 
     return offsets, avg_offset, std_dev
 
 
-def apply_offset(srt_path, offset_seconds, output_path):
-    """Aplica offset"""
-    subs = pysrt.open(srt_path)
+def apply_offset(srt, offset_seconds, output_path):
+    """Aplica offset (um SubRipFile é deslocado no próprio objeto)"""
+    subs = load_subtitles(srt)
     subs.shift(seconds=offset_seconds)
     subs.save(output_path)
 
@@ -386,13 +658,12 @@ def main(video_path, srt_path):
     # Obter framerates
     print("\n📊 A analisar framerates...")
     video_fps = get_video_framerate(video)
-    srt_fps = detect_srt_framerate(srt_original)
+    subs = load_subtitles(srt_original)
+    srt_fps = detect_srt_framerate(subs)
 
     print(f"   🎞️  Vídeo:    {video_fps} fps")
     print(f"   📄  Legenda:  {srt_fps} fps")
 
-    work_file = srt_original.with_suffix('.work.srt')
-
     # Verificar se precisa conversão de framerate
     fps_diff = abs(video_fps - srt_fps) if srt_fps else 0
 
@@ -401,12 +672,10 @@ def main(video_path, srt_path):
         print(f"   Diferença: {fps_diff:.2f} fps")
         print(f"\n🔧 A converter legendas: {srt_fps} fps → {video_fps} fps...")
 
-        convert_framerate(srt_original, srt_fps, video_fps, work_file)
+        convert_framerate(subs, srt_fps, video_fps)
         print(f"   ✅ Conversão concluída!")
     else:
         print(f"   ✅ Framerates compatíveis")
-        import shutil
-        shutil.copy(srt_original, work_file)
 
     # Obter duração
     duration = get_video_duration(video)
@@ -414,23 +683,20 @@ def main(video_path, srt_path):
 
     # Detectar idioma do áudio
     print(f"\n🎙️  A detectar idioma do áudio...")
-    with tempfile.TemporaryDirectory() as tmp:
-        audio = Path(tmp) / "sample.wav"
-        extract_audio(video, audio, start_time=60, duration=30)
-        result = mlx_whisper.transcribe(str(audio), path_or_hf_repo="mlx-community/whisper-tiny")
-        detected_lang = result.get("language", "en")
+    # Deteção na primeira amostra da sincronização (sem extração própria)
+    audios = load_sync_samples(video, duration, num_samples=5)
+    detected_lang = detect_language(audios[0])
 
     print(f"   ✅ Idioma detectado: {detected_lang.upper()}")
 
     # Análise de sincronização
     print(f"\n🔍 A analisar sincronização em 5 pontos...")
     offsets, avg_offset, std_dev = analyze_sync(
-        work_file, video, duration, num_samples=5, language=detected_lang
+        subs, video, duration, num_samples=5, language=detected_lang, audios=audios
     )
 
     if offsets is None:
         print("❌ Erro na análise")
-        work_file.unlink()
         sys.exit(1)
 
     print(f"\n   📈 Offsets detectados:")
@@ -441,18 +707,17 @@ def main(video_path, srt_path):
     print(f"      Média:          {avg_offset:+.2f}s")
     print(f"      Desvio padrão:  {std_dev:.2f}s")
 
+    output = srt_original.with_name(srt_original.stem + ".sync.srt")
+
     # Aplicar correção se necessário
     if abs(avg_offset) > 0.2:
         print(f"\n🔧 A aplicar correção de sincronização: {avg_offset:+.2f}s")
-        apply_offset(work_file, avg_offset, work_file)
+        apply_offset(subs, avg_offset, output)
         print(f"   ✅ Correção aplicada!")
     else:
         print(f"\n   ✅ Já está sincronizado ({avg_offset:+.2f}s)")
-
-    # Guardar resultado
-    output = srt_original.with_name(srt_original.stem + ".sync.srt")
-    import shutil
-    shutil.move(work_file, output)
+        # Guardar resultado
+        subs.save(output)
 
     print(f"\n{'='*70}")
     print(f"✅ SINCRONIZAÇÃO CONCLUÍDA!")
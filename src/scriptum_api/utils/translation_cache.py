@@ -0,0 +1,134 @@
+"""
+Persistent translation memory.
+Stores translated subtitle lines in SQLite so repeated lines are not sent
+to Gemini again across files and runs.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TranslationCache:
+    """
+    SQLite-backed cache of line translations keyed by language pair and text.
+
+    Every operation opens its own short-lived connection, so one instance can
+    be shared by the worker threads of concurrent translations.
+
+    Example:
+        >>> cache = TranslationCache(Path('/tmp/translations.sqlite3'))
+        >>> cache.put_many('en', 'pt-PT', [('Yes.', 'Sim.')])
+        >>> cache.get_many('en', 'pt-PT', ['Yes.', 'No.'])
+        {'Yes.': 'Sim.'}
+    """
+
+    def __init__(self, db_path: Path, max_age_days: int = 30):
+        """
+        Initialize translation cache.
+
+        Args:
+            db_path: SQLite database file (created if missing)
+            max_age_days: Entries older than this are purged on startup
+        """
+        self.db_path = Path(db_path)
+        self.max_age_seconds = max_age_days * 86400
+        self._write_lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                'hash TEXT PRIMARY KEY, src TEXT, tgt TEXT, translated TEXT, ts INTEGER)'
+            )
+        self.purge_expired()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed"""
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _key(source_lang: str, target_lang: str, text: str) -> str:
+        return hashlib.blake2b(
+            f"{source_lang}|{target_lang}|{text}".encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+
+    def get_many(self, source_lang: str, target_lang: str, texts: Iterable[str]) -> Dict[str, str]:
+        """
+        Look up cached translations.
+
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            texts: Original texts
+
+        Returns:
+            Mapping of original text to cached translation (hits only)
+        """
+        keys = {self._key(source_lang, target_lang, text): text for text in texts}
+        if not keys:
+            return {}
+
+        hits = {}
+        key_list = list(keys)
+        with self._connect() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(key_list), 500):
+                chunk = key_list[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT hash, translated FROM translations WHERE hash IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                for key, translated in rows:
+                    hits[keys[key]] = translated
+        return hits
+
+    def put_many(self, source_lang: str, target_lang: str, pairs: Iterable[Tuple[str, str]]) -> None:
+        """
+        Store translations.
+
+        Args:
+            source_lang: Source language code
+            target_lang: Target language code
+            pairs: (original, translated) tuples
+        """
+        now = int(time.time())
+        rows = [
+            (self._key(source_lang, target_lang, original), source_lang, target_lang, translated, now)
+            for original, translated in pairs
+        ]
+        if not rows:
+            return
+
+        with self._write_lock, self._connect() as conn:
+            conn.executemany('INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)', rows)
+
+    def purge_expired(self) -> int:
+        """
+        Remove entries older than max_age_days.
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = int(time.time()) - self.max_age_seconds
+        with self._write_lock, self._connect() as conn:
+            deleted = conn.execute('DELETE FROM translations WHERE ts < ?', (cutoff,)).rowcount
+
+        if deleted:
+            logger.info(f"Translation cache: purged {deleted} expired entries")
+        return deleted
@@ -9,8 +9,9 @@ import sys
 import time
 import json
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Iterable, Iterator, List, Dict, Optional, TextIO, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 
 # =============================================================================
 # Line formatting rules
@@ -22,6 +23,28 @@ TAG_RE = re.compile(r'<[^>]+>')
 LITERAL_BREAK_RE = re.compile(r'(\\n|/n)', re.IGNORECASE)
 SPACED_ELLIPSES_RE = re.compile(r'\.\s+\.\s+\.')
 MULTI_SPACE_RE = re.compile(r'[ \t]{2,}')
+BLOCK_SEP_RE = re.compile(r'\n\s*\n')
+TIMEFRAME_RE = re.compile(r'^\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}$')
+NUMBERED_SPLIT_RE = re.compile(r'\n(?=\d+\.\s)')
+NUMBERED_ITEM_RE = re.compile(r'^\d+\.\s*(.+)$', re.DOTALL)
+
+# Sessão partilhada: reutiliza ligações TCP/TLS ao Gemini entre lotes e entre
+# traduções. pool_maxsize cobre os pedidos concorrentes da TranslationService.
+GEMINI_SESSION = requests.Session()
+GEMINI_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+class GeminiAPIError(Exception):
+    """Resposta de erro da API Gemini, com o código HTTP"""
+
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def retryable(self) -> bool:
+        """Só limites de taxa (429) e erros do servidor (5xx) podem passar ao repetir"""
+        return self.status_code == 429 or self.status_code >= 500
 
 
 class Subtitle:
@@ -42,28 +65,70 @@ class SRTParser:
     @staticmethod
     def parse(content: str) -> List[Subtitle]:
         """Parse conteúdo SRT"""
-        subtitles = []
-        blocks = re.split(r'\n\s*\n', content.strip())
+        return list(SRTParser.iter_parse(content))
 
-        for block in blocks:
-            lines = block.strip().split('\n')
-            if len(lines) < 3:
-                continue
+    @staticmethod
+    def iter_parse(content: str) -> Iterator[Subtitle]:
+        """
+        Parse conteúdo SRT entrada a entrada.
+
+        Percorre os separadores de bloco com finditer em vez de criar a lista
+        completa de blocos com re.split.
+        """
+        content = content.strip()
+        pos = 0
+
+        for sep in BLOCK_SEP_RE.finditer(content):
+            sub = SRTParser._parse_block(content[pos:sep.start()])
+            if sub is not None:
+                yield sub
+            pos = sep.end()
+
+        sub = SRTParser._parse_block(content[pos:])
+        if sub is not None:
+            yield sub
+
+    @staticmethod
+    def iter_parse_file(fileobj: TextIO) -> Iterator[Subtitle]:
+        """
+        Parse um ficheiro SRT linha a linha, sem carregar o conteúdo inteiro.
+
+        Linhas só com espaço em branco separam blocos, como em iter_parse.
+        """
+        lines = []
+        for line in fileobj:
+            if line.strip():
+                lines.append(line.rstrip('\n'))
+            elif lines:
+                sub = SRTParser._parse_block('\n'.join(lines))
+                if sub is not None:
+                    yield sub
+                lines = []
+
+        if lines:
+            sub = SRTParser._parse_block('\n'.join(lines))
+            if sub is not None:
+                yield sub
 
-            id_line = lines[0].strip()
-            timeframe = lines[1].strip()
-            text = '\n'.join(lines[2:]).strip()
+    @staticmethod
+    def _parse_block(block: str) -> Optional[Subtitle]:
+        """Parse um bloco SRT (id, timeframe, texto)"""
+        lines = block.strip().split('\n')
+        if len(lines) < 3:
+            return None
 
-            if SRTParser.is_valid_timeframe(timeframe):
-                subtitles.append(Subtitle(id_line, timeframe, text))
+        id_line = lines[0].strip()
+        timeframe = lines[1].strip()
+        text = '\n'.join(lines[2:]).strip()
 
-        return subtitles
+        if not SRTParser.is_valid_timeframe(timeframe):
+            return None
+        return Subtitle(id_line, timeframe, text)
 
     @staticmethod
     def is_valid_timeframe(timeframe: str) -> bool:
         """Valida formato do timeframe"""
-        pattern = r'^\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}$'
-        return bool(re.match(pattern, timeframe))
+        return bool(TIMEFRAME_RE.match(timeframe))
 
     @staticmethod
     def generate(subtitles: List[Subtitle]) -> str:
@@ -73,6 +138,14 @@ class SRTParser:
             content.append(f"{sub.id}\n{sub.timeframe}\n{sub.text}\n")
         return '\n'.join(content).strip()
 
+    @staticmethod
+    def write(subtitles: Iterable[Subtitle], fileobj: TextIO) -> None:
+        """Escreve legendas SRT diretamente no ficheiro, entrada a entrada"""
+        separator = ''
+        for sub in subtitles:
+            fileobj.write(f"{separator}{sub.id}\n{sub.timeframe}\n{sub.text}")
+            separator = '\n\n'
+
 
 class SubtitleFormatter:
     """Aplica regras de formatação de linhas nas legendas"""
@@ -211,6 +284,8 @@ class GeminiTranslator:
         self.target_lang = target_lang
         self.movie_context = movie_context
         self.api_url = 'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent'
+        self.batch_api_url = 'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:batchGenerateContent'
+        self.batches_url = 'https://generativelanguage.googleapis.com/v1beta'
         self.batch_size = 10
         self.max_retries = 3
         self.retry_delay = 2
@@ -245,35 +320,42 @@ class GeminiTranslator:
 
         return translated
 
+    def _build_request(self, subtitles: List[Subtitle]) -> Dict:
+        """Corpo do pedido generateContent para um lote de legendas"""
+        return {
+            'contents': [{'parts': [{'text': self._build_prompt([sub.text for sub in subtitles])}]}],
+            'generationConfig': {
+                'temperature': 0.3,
+                'topK': 40,
+                'topP': 0.95,
+                'maxOutputTokens': 8192,
+            }
+        }
+
     def _translate_texts(self, subtitles: List[Subtitle]) -> List[Subtitle]:
         """Traduz um lote de legendas"""
-        texts = [sub.text for sub in subtitles]
-        prompt = self._build_prompt(texts)
-
-        response = requests.post(
+        response = GEMINI_SESSION.post(
             f"{self.api_url}?key={self.api_key}",
             headers={'Content-Type': 'application/json'},
-            json={
-                'contents': [{'parts': [{'text': prompt}]}],
-                'generationConfig': {
-                    'temperature': 0.3,
-                    'topK': 40,
-                    'topP': 0.95,
-                    'maxOutputTokens': 8192,
-                }
-            },
+            json=self._build_request(subtitles),
             timeout=30
         )
 
         if not response.ok:
-            error_data = response.json()
-            raise Exception(f"Erro da API: {error_data.get('error', {}).get('message', response.text)}")
+            try:
+                message = response.json().get('error', {}).get('message', response.text)
+            except ValueError:
+                message = response.text
+            raise GeminiAPIError(f"Erro da API: {message}", response.status_code)
+
+        return self._apply_response(subtitles, response.json())
 
-        data = response.json()
+    def _apply_response(self, subtitles: List[Subtitle], data: Dict) -> List[Subtitle]:
+        """Cria as legendas traduzidas a partir de uma resposta generateContent"""
         translated_text = data['candidates'][0]['content']['parts'][0]['text']
 
         # Parse traduções
-        translations = self._parse_translation(translated_text, len(texts))
+        translations = self._parse_translation(translated_text, len(subtitles))
 
         # Criar novos Subtitles com traduções
         translated_subs = []
@@ -286,6 +368,81 @@ class GeminiTranslator:
 
         return translated_subs
 
+    def submit_batch_job(self, batches: List[List[Subtitle]], display_name: str = 'scriptum') -> str:
+        """
+        Submete todos os lotes como um único job da Gemini Batch API
+
+        O job corre de forma assíncrona (custo reduzido, sem limites por
+        minuto) e cada pedido leva o índice do lote como chave.
+
+        Returns:
+            Nome do job (ex.: 'batches/123') para get_batch_job
+        """
+        response = GEMINI_SESSION.post(
+            f"{self.batch_api_url}?key={self.api_key}",
+            headers={'Content-Type': 'application/json'},
+            json={
+                'batch': {
+                    'display_name': display_name,
+                    'input_config': {
+                        'requests': {
+                            'requests': [
+                                {'request': self._build_request(batch), 'metadata': {'key': str(i)}}
+                                for i, batch in enumerate(batches)
+                            ]
+                        }
+                    }
+                }
+            },
+            timeout=120
+        )
+
+        if not response.ok:
+            raise Exception(f"Erro da Batch API: {response.text}")
+
+        return response.json()['name']
+
+    def get_batch_job(self, name: str) -> Dict:
+        """Estado atual de um job da Batch API"""
+        response = GEMINI_SESSION.get(f"{self.batches_url}/{name}?key={self.api_key}", timeout=30)
+
+        if not response.ok:
+            raise Exception(f"Erro da Batch API: {response.text}")
+
+        return response.json()
+
+    @staticmethod
+    def batch_job_state(job: Dict) -> str:
+        """Estado do job (ex.: 'BATCH_STATE_SUCCEEDED')"""
+        return job.get('metadata', {}).get('state', job.get('state', ''))
+
+    def parse_batch_results(
+        self,
+        job: Dict,
+        batches: List[List[Subtitle]]
+    ) -> List[Optional[List[Subtitle]]]:
+        """
+        Extrai as traduções de um job concluído
+
+        Returns:
+            Uma entrada por lote, None para lotes que falharam no job
+        """
+        results: List[Optional[List[Subtitle]]] = [None] * len(batches)
+
+        inlined = job.get('response', {}).get('inlinedResponses', {})
+        if isinstance(inlined, dict):
+            inlined = inlined.get('inlinedResponses', [])
+
+        for position, item in enumerate(inlined):
+            key = item.get('metadata', {}).get('key', position)
+            try:
+                index = int(key)
+                results[index] = self._apply_response(batches[index], item['response'])
+            except (KeyError, IndexError, TypeError, ValueError):
+                continue
+
+        return results
+
     def _build_prompt(self, texts: List[str]) -> str:
         """Constrói prompt para tradução"""
         numbered = '\n'.join([f"{i+1}. {text}" for i, text in enumerate(texts)])
@@ -354,10 +511,10 @@ TRADUÇÕES (mantenha a numeração):"""
         translations = []
 
         # Dividir por blocos numerados
-        blocks = re.split(r'\n(?=\d+\.\s)', text)
+        blocks = NUMBERED_SPLIT_RE.split(text)
 
         for block in blocks:
-            match = re.match(r'^\d+\.\s*(.+)$', block, re.DOTALL)
+            match = NUMBERED_ITEM_RE.match(block)
             if match:
                 translations.append(match.group(1).strip())
 
@@ -412,10 +569,22 @@ class SubtitleValidator:
         return issues
 
     @staticmethod
-    def fix_line_breaks(original: List[Subtitle], translated: List[Subtitle]) -> List[Subtitle]:
-        """Aplica regras de linha nas traduções"""
+    def fix_line_breaks(
+        original: List[Subtitle],
+        translated: List[Subtitle],
+        issues: Optional[Dict] = None
+    ) -> List[Subtitle]:
+        """
+        Aplica regras de linha nas traduções
+
+        Com os issues de validate, só as legendas em line_rule_violations são
+        reformatadas; as restantes já cumprem as regras.
+        """
         fixed = []
         trans_map = {sub.id: sub for sub in translated}
+        violations = None
+        if issues is not None:
+            violations = {v['id'] for v in issues['line_rule_violations']}
 
         for orig in original:
             trans = trans_map.get(orig.id)
@@ -424,6 +593,10 @@ class SubtitleValidator:
                 fixed.append(Subtitle(orig.id, orig.timeframe, orig.text))
                 continue
 
+            if violations is not None and orig.id not in violations:
+                fixed.append(Subtitle(orig.id, orig.timeframe, trans.text))
+                continue
+
             fixed_text = SubtitleFormatter.format_text(trans.text, orig.text)
             fixed.append(Subtitle(orig.id, orig.timeframe, fixed_text))
 
@@ -501,7 +674,7 @@ class SubtitleTranslator:
         final_subs = translated_subs
         if auto_fix and issues['line_rule_violations']:
             print(f"\n🔧 A aplicar regras de linhas em {len(issues['line_rule_violations'])} legendas...")
-            final_subs = self.validator.fix_line_breaks(original_subs, translated_subs)
+            final_subs = self.validator.fix_line_breaks(original_subs, translated_subs, issues)
 
             # Validar novamente
             print("🔍 A validar correções...")
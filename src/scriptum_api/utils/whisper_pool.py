@@ -0,0 +1,83 @@
+"""
+Shared MLX Whisper model cache.
+Loads each Whisper model once per process so language detection and sync
+transcription reuse the same weights instead of reloading them per call.
+"""
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict
+
+# MLX inference is not safe to run concurrently on one model; callers on
+# worker threads (e.g. parallel sync samples) serialize on this lock
+_inference_lock = threading.Lock()
+
+
+@lru_cache(maxsize=2)
+def get_whisper_model(repo: str):
+    """
+    Load an MLX Whisper model once and keep it for the process lifetime.
+
+    Args:
+        repo: Hugging Face repo or local path of the model
+
+    Returns:
+        Loaded mlx_whisper model
+    """
+    import mlx.core as mx
+    from mlx_whisper.load_models import load_model
+
+    return load_model(repo, dtype=mx.float16)
+
+
+def transcribe(audio: Any, repo: str, **kwargs) -> Dict[str, Any]:
+    """
+    Transcribe audio with a cached Whisper model.
+
+    mlx_whisper.transcribe only takes a repo name and keeps a single model in
+    its own holder, so the holder is seeded with the cached model first.
+
+    Args:
+        audio: Audio file path or waveform
+        repo: Hugging Face repo or local path of the model
+        **kwargs: Extra options for mlx_whisper.transcribe (language, ...)
+
+    Returns:
+        mlx_whisper transcription result
+    """
+    import mlx_whisper
+    from mlx_whisper.transcribe import ModelHolder
+
+    with _inference_lock:
+        model = get_whisper_model(repo)
+        if ModelHolder.model is not model:
+            ModelHolder.model = model
+            ModelHolder.model_path = repo
+
+        return mlx_whisper.transcribe(audio, path_or_hf_repo=repo, **kwargs)
+
+
+def detect_language(audio: Any, repo: str) -> str:
+    """
+    Detect the spoken language using only the Whisper encoder.
+
+    Runs the language-ID head on the padded mel spectrogram of the first
+    30 seconds, without any decoder passes.
+
+    Args:
+        audio: Audio file path or waveform
+        repo: Hugging Face repo or local path of the model
+
+    Returns:
+        Language code (en, pt, etc)
+    """
+    import mlx.core as mx
+    from mlx_whisper.audio import N_FRAMES, log_mel_spectrogram, pad_or_trim
+
+    with _inference_lock:
+        model = get_whisper_model(repo)
+        mel = log_mel_spectrogram(audio, n_mels=model.dims.n_mels)
+        mel = pad_or_trim(mel, N_FRAMES, axis=-2).astype(mx.float16)
+        _, probs = model.detect_language(mel)
+
+    return max(probs, key=probs.get)
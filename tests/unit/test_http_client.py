@@ -0,0 +1,160 @@
+"""
+Unit tests for HTTPClient retries and response caching.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from scriptum_api.utils import http_client
+from scriptum_api.utils.http_client import HTTPClient, _retry_delay
+
+
+def make_response(status_code, data=None, headers=None):
+    response = Mock(status_code=status_code, headers=headers or {})
+    response.json.return_value = data
+    return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = Mock()
+    monkeypatch.setattr(HTTPClient, '_get_session', classmethod(lambda cls: session))
+    monkeypatch.setattr(HTTPClient, '_response_cache', {})
+    return session
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(http_client.time, 'sleep', calls.append)
+    return calls
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(http_client.time, 'monotonic', lambda: now[0])
+    return now
+
+
+class TestRetryDelay:
+    """Tests for the backoff between attempts."""
+
+    def test_full_jitter_is_bounded_by_exponential_cap(self, monkeypatch):
+        """Test that the jitter range doubles per attempt up to the cap."""
+        monkeypatch.setattr(http_client.random, 'uniform', lambda low, high: high)
+
+        assert [_retry_delay(attempt) for attempt in range(3)] == [0.1, 0.2, 0.4]
+        assert _retry_delay(20) == 5.0
+
+    def test_retry_after_header_is_honored_and_capped(self):
+        """Test numeric Retry-After, capped at 30s; dates fall back to backoff."""
+        assert _retry_delay(0, make_response(429, headers={'Retry-After': '3'})) == 3.0
+        assert _retry_delay(0, make_response(429, headers={'Retry-After': '999'})) == 30
+        assert _retry_delay(0, make_response(429, headers={'Retry-After': 'Wed, 21 Oct 2026 07:28:00 GMT'})) <= 0.1
+
+
+class TestGetRetries:
+    """Tests for which GET failures are retried."""
+
+    def test_server_error_is_retried(self, session, sleeps):
+        """Test that a 503 is retried after a backoff sleep."""
+        session.get.side_effect = [make_response(503), make_response(200, {'ok': True})]
+
+        assert HTTPClient.get('https://api.test/x') == {'ok': True}
+        assert session.get.call_count == 2
+        assert len(sleeps) == 1
+
+    def test_rate_limit_waits_for_retry_after(self, session, sleeps):
+        """Test that a 429 sleeps for its Retry-After value."""
+        session.get.side_effect = [
+            make_response(429, headers={'Retry-After': '2'}),
+            make_response(200, {'ok': True})
+        ]
+
+        assert HTTPClient.get('https://api.test/x') == {'ok': True}
+        assert sleeps == [2.0]
+
+    @pytest.mark.parametrize('status', [400, 401, 403])
+    def test_client_error_is_not_retried(self, session, sleeps, status):
+        """Test that 4xx responses other than 429 fail at once."""
+        session.get.return_value = make_response(status)
+
+        assert HTTPClient.get('https://api.test/x') is None
+        assert session.get.call_count == 1
+        assert sleeps == []
+
+    def test_timeouts_retry_until_max_retries(self, session, sleeps):
+        """Test that timeouts are retried and give up after max_retries."""
+        session.get.side_effect = requests.Timeout()
+
+        assert HTTPClient.get('https://api.test/x', max_retries=3) is None
+        assert session.get.call_count == 3
+        assert len(sleeps) == 2
+
+
+class TestGetCache:
+    """Tests for cache_ttl freshness and ETag revalidation."""
+
+    def test_fresh_response_is_served_without_request(self, session, clock):
+        """Test that a cached response is reused within cache_ttl."""
+        session.get.return_value = make_response(200, {'v': 1}, {'ETag': '"abc"'})
+
+        HTTPClient.get('https://api.test/x', cache_ttl=60)
+        clock[0] += 59
+
+        assert HTTPClient.get('https://api.test/x', cache_ttl=60) == {'v': 1}
+        assert session.get.call_count == 1
+
+    def test_stale_response_is_revalidated_with_etag(self, session, clock):
+        """Test that a 304 keeps the cached body and renews freshness."""
+        session.get.side_effect = [
+            make_response(200, {'v': 1}, {'ETag': '"abc"', 'Last-Modified': 'Tue, 01 Sep 2026 00:00:00 GMT'}),
+            make_response(304),
+        ]
+
+        HTTPClient.get('https://api.test/x', headers={'Api-Key': 'k'}, cache_ttl=60)
+        clock[0] += 61
+
+        assert HTTPClient.get('https://api.test/x', headers={'Api-Key': 'k'}, cache_ttl=60) == {'v': 1}
+        sent = session.get.call_args.kwargs['headers']
+        assert sent['If-None-Match'] == '"abc"'
+        assert sent['If-Modified-Since'] == 'Tue, 01 Sep 2026 00:00:00 GMT'
+        assert sent['Api-Key'] == 'k'
+
+        # Renewed: no third request within the next cache_ttl
+        clock[0] += 59
+        assert HTTPClient.get('https://api.test/x', headers={'Api-Key': 'k'}, cache_ttl=60) == {'v': 1}
+        assert session.get.call_count == 2
+
+    def test_changed_resource_replaces_cached_body(self, session, clock):
+        """Test that a 200 on revalidation stores the new body."""
+        session.get.side_effect = [
+            make_response(200, {'v': 1}, {'ETag': '"abc"'}),
+            make_response(200, {'v': 2}, {'ETag': '"def"'}),
+        ]
+
+        HTTPClient.get('https://api.test/x', cache_ttl=60)
+        clock[0] += 61
+
+        assert HTTPClient.get('https://api.test/x', cache_ttl=60) == {'v': 2}
+        assert HTTPClient._response_cache[HTTPClient._cache_key('https://api.test/x', None, None)][1] == '"def"'
+
+    def test_cache_is_keyed_by_headers(self, session, clock):
+        """Test that requests with different auth headers don't share entries."""
+        session.get.side_effect = [make_response(200, {'user': 'a'}), make_response(200, {'user': 'b'})]
+
+        assert HTTPClient.get('https://api.test/me', headers={'Api-Key': 'a'}, cache_ttl=60) == {'user': 'a'}
+        assert HTTPClient.get('https://api.test/me', headers={'Api-Key': 'b'}, cache_ttl=60) == {'user': 'b'}
+
+    def test_without_cache_ttl_every_call_requests(self, session):
+        """Test that caching is opt-in."""
+        session.get.return_value = make_response(200, {'v': 1}, {'ETag': '"abc"'})
+
+        HTTPClient.get('https://api.test/x')
+        HTTPClient.get('https://api.test/x')
+
+        assert session.get.call_count == 2
+        assert 'If-None-Match' not in (session.get.call_args.kwargs['headers'] or {})
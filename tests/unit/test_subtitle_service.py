@@ -0,0 +1,113 @@
+"""
+Unit tests for subtitle search scoring, filename parsing and hashing.
+"""
+
+import pytest
+
+from scriptum_api.services.subtitle_service import SubtitleService
+
+
+@pytest.fixture
+def service():
+    return SubtitleService('test-key')
+
+
+def score(query, name):
+    return SubtitleService._score_movie(SubtitleService._prepare_query(query), name)
+
+
+class TestScoreMovie:
+    """Tests for relevance scoring of result names."""
+
+    def test_exact_title_scores_one(self):
+        """Test that the same keywords give a perfect score."""
+        assert score('The Matrix 1999', 'The Matrix (1999)') == pytest.approx(1.0)
+
+    def test_extra_words_lower_similarity_only(self):
+        """Test that full overlap with extra words is scored by Dice similarity."""
+        # overlap 1/1, Dice 2*1/(1+2)
+        assert score('Matrix', 'Matrix Reloaded') == pytest.approx(0.8 + 0.2 * 2 / 3)
+
+    def test_low_overlap_skips_similarity(self):
+        """Test the early exit below 50% keyword overlap."""
+        # 1 of 3 query keywords matches
+        assert score('Matrix Reloaded Revolutions', 'The Matrix') == pytest.approx(0.8 / 3)
+
+    def test_query_without_keywords_is_neutral(self):
+        """Test that a query of stop words and years scores 0.5."""
+        assert score('The 2010', 'Anything') == 0.5
+
+    def test_ranking(self):
+        """Test the order of a typical result set."""
+        names = ['Matrix Reloaded', 'The Matrix', 'The Animatrix', 'Matrix Reloaded Extended Cut']
+
+        ranked = sorted(names, key=lambda name: score('The Matrix', name), reverse=True)
+
+        assert ranked == ['The Matrix', 'Matrix Reloaded', 'Matrix Reloaded Extended Cut', 'The Animatrix']
+
+    def test_filter_and_sort_drops_irrelevant_results(self, service):
+        """Test that results under 60% relevance are dropped and the rest ranked."""
+        results = [
+            {'name': 'The Animatrix', 'downloads': 100000, 'rating': 10},
+            {'name': 'Matrix Reloaded', 'downloads': 10, 'rating': 0},
+            {'name': 'The Matrix', 'downloads': 10, 'rating': 0},
+        ]
+
+        filtered = service._filter_and_sort_results(results, 'The Matrix')
+
+        assert [r['name'] for r in filtered] == ['The Matrix', 'Matrix Reloaded']
+
+
+class TestQuickSearch:
+    """Tests for the query quick_search builds from a filename."""
+
+    @pytest.fixture
+    def queries(self, service, monkeypatch):
+        calls = []
+        monkeypatch.setattr(service, 'search_by_query', lambda query, language, limit: calls.append(query) or [])
+        return calls
+
+    @pytest.mark.parametrize('filename, expected', [
+        ('Inception.2010.1080p.BluRay.x264-YIFY.mkv', 'Inception 2010'),
+        ('The_Dark_Knight_2008_720p_HDTV.mp4', 'The Dark Knight 2008'),
+        ('Movie.Name.2021.WEB-DL.AAC.mkv', 'Movie Name 2021'),
+        ('Movie.Name.2021.WEBRip.x265.HEVC.mkv', 'Movie Name 2021'),
+        ('Some Film.avi', 'Some Film'),
+        ('Blade.Runner.2049.4K.mkv', 'Blade Runner 2049'),
+    ])
+    def test_query_from_filename(self, service, queries, filename, expected):
+        """Test separators become spaces and release tags are removed."""
+        service.quick_search(filename)
+
+        assert queries == [expected]
+
+    def test_tags_inside_words_are_kept(self, service, queries):
+        """Test that tag names are only removed as whole words."""
+        service.quick_search('Dtsomething.Haachi.mkv')
+
+        assert queries == ['Dtsomething Haachi']
+
+
+class TestCalculateHash:
+    """Tests for the OpenSubtitles file hash."""
+
+    def test_known_answer(self, tmp_path):
+        """Test the hash of a fixed 200000-byte file."""
+        video = tmp_path / 'video.bin'
+        video.write_bytes(bytes((i * 7 + 3) % 256 for i in range(200000)))
+
+        assert SubtitleService.calculate_hash(video) == '60a0df1f5fa2cd40'
+
+    def test_words_are_signed_and_wrap_at_64_bits(self, tmp_path):
+        """Test that 0xFF..FF words count as -1 (size 131072 minus 16384 words)."""
+        video = tmp_path / 'video.bin'
+        video.write_bytes(b'\xff' * 131072)
+
+        assert SubtitleService.calculate_hash(video) == '000000000001c000'
+
+    def test_small_file_has_no_hash(self, tmp_path):
+        """Test that files under 128 KiB are not hashed."""
+        video = tmp_path / 'video.bin'
+        video.write_bytes(b'\0' * 1000)
+
+        assert SubtitleService.calculate_hash(video) is None
@@ -0,0 +1,98 @@
+"""
+Unit tests for subtitle quality validation timings.
+"""
+
+from scriptum_api.utils.subtitle_validator import validate_subtitles
+
+
+def srt(*cues):
+    return '\n\n'.join(
+        f"{i}\n{start} --> {end}\n{text}" for i, (start, end, text) in enumerate(cues, 1)
+    )
+
+
+def problem_types(result):
+    return [(p['index'], p['type'], p['severity']) for p in result['problems']]
+
+
+class TestValidateSubtitlesTimings:
+    """Tests for millisecond-exact duration, gap and CPS checks."""
+
+    def test_80ms_gap_is_not_too_small(self):
+        """Test that a gap of exactly 80ms is accepted."""
+        result = validate_subtitles(srt(
+            ('00:00:01,000', '00:00:02,840', 'Olá.'),
+            ('00:00:02,920', '00:00:04,000', 'Adeus.'),
+        ))
+
+        assert problem_types(result) == []
+
+    def test_79ms_gap_is_too_small(self):
+        """Test that a gap under 80ms is flagged with its exact value."""
+        result = validate_subtitles(srt(
+            ('00:00:01,000', '00:00:02,841', 'Olá.'),
+            ('00:00:02,920', '00:00:04,000', 'Adeus.'),
+        ))
+
+        assert problem_types(result) == [(2, 'gap_too_small', 'warning')]
+        assert result['problems'][0]['message'] == 'Gap muito pequeno: 79ms (mín: 80ms)'
+
+    def test_duration_bounds(self):
+        """Test the 1s minimum and 6s maximum, both inclusive."""
+        result = validate_subtitles(srt(
+            ('00:00:01,000', '00:00:01,999', 'Sim.'),
+            ('00:00:03,000', '00:00:04,000', 'Sim.'),
+            ('00:00:05,000', '00:00:11,000', 'Sim.'),
+            ('00:00:12,000', '00:00:18,001', 'Sim.'),
+        ))
+
+        assert problem_types(result) == [
+            (1, 'short_duration', 'warning'),
+            (4, 'long_duration', 'warning'),
+        ]
+
+    def test_long_duration_becomes_error_past_9s(self):
+        """Test that durations over 1.5x the maximum are errors."""
+        result = validate_subtitles(srt(
+            ('00:00:01,000', '00:00:10,000', 'Sim.'),
+            ('00:00:11,000', '00:00:20,001', 'Sim.'),
+        ))
+
+        assert problem_types(result) == [
+            (1, 'long_duration', 'warning'),
+            (2, 'long_duration', 'error'),
+        ]
+
+    def test_cps_ignores_line_breaks(self):
+        """Test CPS from integer milliseconds, without counting line breaks."""
+        # 17 visible chars over 1s is exactly the limit; 18 is over it
+        result = validate_subtitles(srt(
+            ('00:00:01,000', '00:00:02,000', 'abcdefgh\nijklmnopq'),
+            ('00:00:03,000', '00:00:04,000', 'abcdefghi\nijklmnopq'),
+        ))
+
+        assert problem_types(result) == [(2, 'high_cps', 'warning')]
+        assert result['problems'][0]['message'].startswith('CPS muito alto: 18.0 chars/s')
+
+    def test_overlap_and_long_pause(self):
+        """Test overlap and long-pause messages from millisecond gaps."""
+        result = validate_subtitles(srt(
+            ('00:00:01,000', '00:00:03,000', 'Um.'),
+            ('00:00:02,750', '00:00:04,000', 'Dois.'),
+            ('00:01:05,000', '00:01:06,500', 'Três.'),
+        ))
+
+        assert problem_types(result) == [
+            (2, 'overlap', 'error'),
+            (3, 'long_pause', 'error'),
+        ]
+        assert result['problems'][0]['message'] == 'Sobreposição de 0.25s com legenda anterior'
+        assert result['problems'][1]['message'] == 'Pausa muito longa: 61.0s antes desta legenda'
+
+    def test_empty_input(self):
+        """Test that empty content has no entries and zeroed stats."""
+        result = validate_subtitles('  \n')
+
+        assert result['total_entries'] == 0
+        assert result['has_problems'] is False
+        assert set(result['stats'].values()) == {0}
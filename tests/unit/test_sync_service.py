@@ -0,0 +1,89 @@
+"""
+Unit tests for the SyncService.sync_subtitles result contract.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from scriptum_api.services.sync_service import SyncService
+
+
+PATHS = (Path('video.mp4'), Path('subs.srt'), Path('out.srt'), Path('/tmp'))
+
+
+@pytest.fixture
+def impl_result(monkeypatch):
+    result = {}
+    monkeypatch.setattr(SyncService, '_sync_impl', staticmethod(lambda *args, **kwargs: dict(result)))
+    return result
+
+
+def test_success_keeps_original_shape(impl_result):
+    """Test that success results carry 'offset' and no version-info keys."""
+    impl_result.update({
+        'success': True,
+        'offset_detected': -1.25,
+        'confidence': 0.95,
+        'video_fps': 23.976,
+        'subtitle_fps': None,
+        'language': 'en',
+        'duration': 5400.0,
+        'details': {
+            'offsets': [-1.2, -1.3],
+            'std_dev': 0.05,
+            'num_valid_points': 2,
+            'num_total_points': 5,
+            'confidence_level': 'ALTA'
+        },
+        'video_info': {},
+        'subtitle_info': {},
+        'version_mismatch': False
+    })
+
+    result = SyncService.sync_subtitles(*PATHS)
+
+    assert result == {
+        'success': True,
+        'offset': -1.25,
+        'confidence': 0.95,
+        'video_fps': 23.976,
+        'subtitle_fps': None,
+        'language': 'en',
+        'duration': 5400.0,
+        'details': {
+            'offsets': [-1.2, -1.3],
+            'std_dev': 0.05,
+            'num_valid_points': 2,
+            'num_total_points': 5
+        }
+    }
+
+
+def test_offset_failure_keeps_english_error(impl_result):
+    """Test that a failed offset calculation reports the original error."""
+    impl_result.update({
+        'success': False,
+        'error': 'Não foi possível calcular o offset de sincronização',
+        'language': 'pt',
+        'duration': 120.0,
+        'offset_detected': None,
+        'video_info': {},
+        'subtitle_info': {},
+        'version_mismatch': True
+    })
+
+    assert SyncService.sync_subtitles(*PATHS) == {
+        'success': False,
+        'error': 'Failed to calculate synchronization offset',
+        'language': 'pt',
+        'duration': 120.0,
+        'offset_detected': None
+    }
+
+
+def test_exception_is_passed_through(impl_result):
+    """Test that unexpected errors keep their message."""
+    impl_result.update({'success': False, 'error': 'ffprobe not found'})
+
+    assert SyncService.sync_subtitles(*PATHS) == {'success': False, 'error': 'ffprobe not found'}
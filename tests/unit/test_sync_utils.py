@@ -0,0 +1,124 @@
+"""
+Unit tests for subtitle sync helpers.
+"""
+
+import pysrt
+import pytest
+
+from scriptum_api.utils.sync_utils import (
+    compute_offset_for_segment,
+    convert_framerate,
+    detect_srt_framerate,
+    language_from_filename
+)
+
+
+def make_subs(start_ms_values, duration_ms=500):
+    subs = pysrt.SubRipFile()
+    for i, start_ms in enumerate(start_ms_values, 1):
+        subs.append(pysrt.SubRipItem(
+            index=i,
+            start=pysrt.SubRipTime(milliseconds=start_ms),
+            end=pysrt.SubRipTime(milliseconds=start_ms + duration_ms),
+            text=f"Line {i}"
+        ))
+    return subs
+
+
+class TestComputeOffsetForSegment:
+    """Tests for matching transcribed segments to subtitle starts."""
+
+    def test_median_of_matched_offsets(self):
+        """Test offsets against the first subtitle inside the 5s window."""
+        segments = [{'start': 1.0}, {'start': 11.5}]
+
+        # 9.0 -> 10.0 and 19.5 -> 20.0
+        assert compute_offset_for_segment([10.0, 20.0, 30.0], segments, 8) == pytest.approx(-0.75)
+
+    def test_first_subtitle_in_window_wins_over_nearest(self):
+        """Test that the earliest start in the window is used, as the linear scan did."""
+        assert compute_offset_for_segment([20.0, 25.0], [{'start': 24.0}], 0) == pytest.approx(4.0)
+
+    def test_window_bounds_are_exclusive(self):
+        """Test that a subtitle exactly 5s away does not match."""
+        assert compute_offset_for_segment([10.0], [{'start': 15.0}, {'start': 5.0}], 0) is None
+
+    def test_only_first_15_segments_are_used(self):
+        """Test that segments past the 15th are ignored."""
+        segments = [{'start': 100.0}] * 15 + [{'start': 10.0}]
+
+        assert compute_offset_for_segment([10.0], segments, 0) is None
+
+    def test_no_subtitles(self):
+        """Test that an empty subtitle list gives no offset."""
+        assert compute_offset_for_segment([], [{'start': 1.0}], 0) is None
+
+
+class TestDetectSrtFramerate:
+    """Tests for inferring the subtitle framerate from millisecond patterns."""
+
+    @staticmethod
+    def frame_starts(fps, count=200):
+        return [round(k * 1000 / fps) for k in range(count)]
+
+    @pytest.mark.parametrize('fps, expected', [
+        (24, 24),
+        (25, 25),   # ties with 50; the first candidate wins
+        (30, 30),   # ties with 60
+    ])
+    def test_detects_frame_aligned_timings(self, fps, expected):
+        """Test detection of subtitles timed on frame boundaries."""
+        assert detect_srt_framerate(make_subs(self.frame_starts(fps))) == expected
+
+    def test_falls_back_to_25_without_matches(self):
+        """Test the 25fps default when no candidate matches."""
+        assert detect_srt_framerate(make_subs([7] * 200)) == 25.0
+
+    def test_needs_100_subtitles(self):
+        """Test that short files are not analysed."""
+        assert detect_srt_framerate(make_subs(self.frame_starts(24, count=99))) is None
+
+
+class TestConvertFramerate:
+    """Tests for rescaling subtitle timings."""
+
+    def test_scales_and_truncates_in_place(self):
+        """Test that ordinals are scaled by to/from and truncated like int()."""
+        subs = make_subs([1000, 2500, 3003], duration_ms=1000)
+
+        result = convert_framerate(subs, 25, 24)
+
+        assert result is subs
+        assert [s.start.ordinal for s in subs] == [960, 2400, 2882]
+        assert [s.end.ordinal for s in subs] == [1920, 3360, 3842]
+
+    def test_saves_when_output_path_is_given(self, tmp_path):
+        """Test that the converted file is written to output_path."""
+        output = tmp_path / 'converted.srt'
+
+        convert_framerate(make_subs([1000]), 25, 24, output)
+
+        assert pysrt.open(str(output))[0].start.ordinal == 960
+
+
+class TestLanguageFromFilename:
+    """Tests for reading the language tag from a subtitle filename."""
+
+    @pytest.mark.parametrize('filename, expected', [
+        ('movie.en.srt', 'en'),
+        ('movie.por.srt', 'pt'),
+        ('movie.pt-BR.srt', 'pt'),
+        ('Movie.EN.srt', 'en'),
+        ('Movie.Eng.srt', 'en'),
+        ('movie.it.srt', 'it'),
+        ('Movie.IT.srt', 'it'),
+        ('movie.srt', None),
+        ('movie.xx.srt', None),
+    ])
+    def test_language_tags(self, filename, expected):
+        """Test ISO 639-1/639-2 tags with and without region."""
+        assert language_from_filename(filename) == expected
+
+    def test_title_word_is_not_a_language(self):
+        """Test that 'Movie.It.srt' is not read as Italian."""
+        assert language_from_filename('Movie.It.srt') is None
@@ -0,0 +1,45 @@
+"""
+Unit tests for the persistent translation cache.
+"""
+
+import pytest
+from scriptum_api.utils.translation_cache import TranslationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranslationCache(tmp_path / 'cache' / 'translations.sqlite3')
+
+
+def test_get_many_returns_only_hits(cache):
+    """Test that lookups return cached lines and skip misses."""
+    cache.put_many('en', 'pt-PT', [('Yes.', 'Sim.'), ('No.', 'Não.')])
+
+    assert cache.get_many('en', 'pt-PT', ['Yes.', 'No.', 'Maybe.']) == {
+        'Yes.': 'Sim.',
+        'No.': 'Não.'
+    }
+
+
+def test_cache_is_keyed_by_language_pair(cache):
+    """Test that a translation is not reused for another language pair."""
+    cache.put_many('en', 'pt-PT', [('Yes.', 'Sim.')])
+
+    assert cache.get_many('en', 'es', ['Yes.']) == {}
+
+
+def test_get_many_handles_large_lookups(cache):
+    """Test lookups larger than SQLite's bound-parameter limit."""
+    texts = [f"line {i}" for i in range(1200)]
+    cache.put_many('en', 'pt-PT', [(text, text.upper()) for text in texts])
+
+    assert len(cache.get_many('en', 'pt-PT', texts)) == 1200
+
+
+def test_purge_expired_removes_old_entries(cache):
+    """Test that entries past max age are purged."""
+    cache.put_many('en', 'pt-PT', [('Yes.', 'Sim.')])
+    cache.max_age_seconds = -1
+
+    assert cache.purge_expired() == 1
+    assert cache.get_many('en', 'pt-PT', ['Yes.']) == {}
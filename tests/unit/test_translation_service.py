@@ -0,0 +1,112 @@
+"""
+Unit tests for translation batching and retry handling.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from scriptum_api.services import translation_service
+from scriptum_api.services.translation_service import TranslationService
+from scriptum_api.utils.translation_utils import GeminiAPIError, Subtitle
+
+
+def make_subs(*texts):
+    return [
+        Subtitle(str(i + 1), "00:00:01,000 --> 00:00:02,000", text)
+        for i, text in enumerate(texts)
+    ]
+
+
+class TestPackBatches:
+    """Tests for token-budget batch packing."""
+
+    def test_short_lines_share_a_batch_up_to_max_items(self):
+        """Test that short lines are packed until the item limit."""
+        subs = make_subs(*['Hi.'] * 5)
+
+        batches = TranslationService._pack_batches(subs, max_tokens=100, max_items=2)
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_long_line_closes_the_batch_early(self):
+        """Test that a batch is closed before exceeding the token budget."""
+        # 'a' * 40 is estimated at 11 tokens, 'Hi.' at 1
+        subs = make_subs('Hi.', 'a' * 40, 'Hi.', 'Hi.')
+
+        batches = TranslationService._pack_batches(subs, max_tokens=12, max_items=10)
+
+        assert [[sub.id for sub in batch] for batch in batches] == [['1', '2'], ['3', '4']]
+
+    def test_oversized_line_gets_its_own_batch(self):
+        """Test that a line above the budget is still sent, alone."""
+        subs = make_subs('a' * 200, 'Hi.')
+
+        batches = TranslationService._pack_batches(subs, max_tokens=10, max_items=10)
+
+        assert [len(batch) for batch in batches] == [1, 1]
+
+    def test_preserves_order(self):
+        """Test that packing keeps subtitle order."""
+        subs = make_subs(*[f"line {i}" for i in range(25)])
+
+        batches = TranslationService._pack_batches(subs, max_tokens=20, max_items=7)
+
+        assert [sub for batch in batches for sub in batch] == subs
+
+
+class TestTranslateBatchWithRetry:
+    """Tests for retry, splitting and failure isolation."""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        monkeypatch.setattr(translation_service.time, 'sleep', lambda seconds: None)
+        service = TranslationService('test-key')
+        service.translator = Mock(max_retries=2, retry_delay=0)
+        return service
+
+    @staticmethod
+    def translate_or_fail(error):
+        """Translator stub that fails any batch containing 'bad'"""
+        def translate(batch):
+            if any(sub.text == 'bad' for sub in batch):
+                raise error
+            return [Subtitle(sub.id, sub.timeframe, sub.text.upper()) for sub in batch]
+        return translate
+
+    def test_transient_failure_isolates_the_bad_entry(self, service):
+        """Test that a 5xx on one entry only leaves that entry untranslated."""
+        service.translator._translate_texts.side_effect = self.translate_or_fail(
+            GeminiAPIError("Erro da API: unavailable", 503)
+        )
+        batch = make_subs('one', 'two', 'bad', 'four')
+
+        translated, _, failed = service._translate_batch_with_retry(batch, 0)
+
+        assert [sub.text for sub in translated] == ['ONE', 'TWO', 'bad', 'FOUR']
+        assert failed == 1
+
+    def test_timeout_is_retried(self, service):
+        """Test that a timeout is retried before succeeding."""
+        batch = make_subs('one')
+        service.translator._translate_texts.side_effect = [
+            requests.Timeout(),
+            [Subtitle('1', batch[0].timeframe, 'UM')]
+        ]
+
+        translated, _, failed = service._translate_batch_with_retry(batch, 0)
+
+        assert [sub.text for sub in translated] == ['UM']
+        assert failed == 0
+        assert service.translator._translate_texts.call_count == 2
+
+    @pytest.mark.parametrize('status', [400, 401, 403])
+    def test_client_error_is_raised_without_retry(self, service, status):
+        """Test that errors retrying cannot fix stop at the first call."""
+        service.translator._translate_texts.side_effect = GeminiAPIError("Erro da API: denied", status)
+
+        with pytest.raises(GeminiAPIError):
+            service._translate_batch_with_retry(make_subs('one', 'two'), 0)
+
+        assert service.translator._translate_texts.call_count == 1
@@ -0,0 +1,127 @@
+"""
+Unit tests for SRT parsing/writing and line-break fixes.
+"""
+
+import io
+
+from scriptum_api.utils.translation_utils import SRTParser, Subtitle, SubtitleValidator
+
+
+SRT_CONTENT = (
+    "1\n"
+    "00:00:01,000 --> 00:00:02,000\n"
+    "Hello.\n"
+    "\n"
+    "2\n"
+    "00:00:03,000 --> 00:00:04,500\n"
+    "Two\n"
+    "lines.\n"
+    "\n"
+    "\n"
+    "3\n"
+    "not a timeframe\n"
+    "Skipped.\n"
+    "\n"
+    "4\n"
+    "00:00:05,000 --> 00:00:06,000\n"
+    "Last.\n"
+)
+
+
+class TestSRTParser:
+    """Tests for streaming SRT parsing and writing."""
+
+    def test_iter_parse_file_matches_parse(self):
+        """Test that line-by-line parsing gives the same entries as parse."""
+        expected = SRTParser.parse(SRT_CONTENT)
+
+        parsed = list(SRTParser.iter_parse_file(io.StringIO(SRT_CONTENT)))
+
+        assert [(s.id, s.timeframe, s.text) for s in parsed] == [
+            (s.id, s.timeframe, s.text) for s in expected
+        ]
+        assert [s.id for s in parsed] == ['1', '2', '4']
+        assert parsed[1].text == 'Two\nlines.'
+
+    def test_iter_parse_file_treats_whitespace_lines_as_separators(self):
+        """Test that a line with only spaces ends a block."""
+        content = "1\n00:00:01,000 --> 00:00:02,000\nA\n   \n2\n00:00:03,000 --> 00:00:04,000\nB"
+
+        parsed = list(SRTParser.iter_parse_file(io.StringIO(content)))
+
+        assert [s.text for s in parsed] == ['A', 'B']
+
+    def test_write_matches_generate(self):
+        """Test that streamed output is identical to generate."""
+        subs = SRTParser.parse(SRT_CONTENT)
+        out = io.StringIO()
+
+        SRTParser.write(subs, out)
+
+        assert out.getvalue() == SRTParser.generate(subs)
+
+    def test_write_round_trips(self):
+        """Test that written output parses back to the same entries."""
+        subs = SRTParser.parse(SRT_CONTENT)
+        out = io.StringIO()
+
+        SRTParser.write(subs, out)
+        reparsed = SRTParser.parse(out.getvalue())
+
+        assert [(s.id, s.timeframe, s.text) for s in reparsed] == [
+            (s.id, s.timeframe, s.text) for s in subs
+        ]
+
+
+class TestFixLineBreaks:
+    """Tests for SubtitleValidator.fix_line_breaks."""
+
+    LONG_TEXT = "This translated line is far too long to fit on one subtitle line"
+
+    def make_pair(self):
+        original = [
+            Subtitle('1', "00:00:01,000 --> 00:00:02,000", "First"),
+            Subtitle('2', "00:00:03,000 --> 00:00:04,000", "Second"),
+        ]
+        translated = [
+            Subtitle('1', "00:00:01,000 --> 00:00:02,000", self.LONG_TEXT),
+            Subtitle('2', "00:00:03,000 --> 00:00:04,000", self.LONG_TEXT),
+        ]
+        return original, translated
+
+    def test_without_issues_reformats_every_entry(self):
+        """Test that all entries are reformatted when no issues are given."""
+        original, translated = self.make_pair()
+
+        fixed = SubtitleValidator.fix_line_breaks(original, translated)
+
+        assert all('\n' in sub.text for sub in fixed)
+
+    def test_with_issues_reformats_only_flagged_entries(self):
+        """Test that only entries listed as violations are reformatted."""
+        original, translated = self.make_pair()
+        issues = {'line_rule_violations': [{'id': '1'}]}
+
+        fixed = SubtitleValidator.fix_line_breaks(original, translated, issues)
+
+        assert '\n' in fixed[0].text
+        assert fixed[1].text == self.LONG_TEXT
+
+    def test_validate_then_fix_matches_full_fix(self):
+        """Test that fixing only validate's violations equals fixing everything."""
+        original, translated = self.make_pair()
+        translated[1] = Subtitle('2', "00:00:03,000 --> 00:00:04,000", "Short.")
+
+        issues = SubtitleValidator.validate(original, translated)
+
+        assert [(s.id, s.text) for s in SubtitleValidator.fix_line_breaks(original, translated, issues)] == [
+            (s.id, s.text) for s in SubtitleValidator.fix_line_breaks(original, translated)
+        ]
+
+    def test_missing_translation_keeps_original(self):
+        """Test that an entry without translation keeps its original text."""
+        original, translated = self.make_pair()
+
+        fixed = SubtitleValidator.fix_line_breaks(original, translated[:1], {'line_rule_violations': []})
+
+        assert fixed[1].text == "Second"